@@ -7,9 +7,11 @@ Run from the root dir by `python -m examples.overlay [--logfile <path-to-logfile
 import functools
 import logging
 import platform
+import sqlite3
 import sys
+import threading
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import date, datetime
 from itertools import count
 from pathlib import Path
@@ -30,6 +32,7 @@ from examples.overlay.settings import Settings, get_settings
 from examples.overlay.state import OverlayState
 from examples.overlay.threading import prepare_overlay
 from examples.overlay.user_interaction import prompt_for_logfile_path, wait_for_api_key
+from prism.minecraft import DiskUUIDCache, set_disk_uuid_cache
 
 # Variable that stores our singleinstance lock so that it doesn't go out of scope
 # and get released
@@ -68,10 +71,11 @@ def process_loglines_to_stdout(
     controller: OverlayController,
     loglines: Iterable[str],
     thread_count: int,
+    at_eof: Callable[[], bool] | None = None,
 ) -> None:  # pragma: nocover
     """Process the state changes for each logline and redraw the screen if neccessary"""
     get_stat_list = prepare_overlay(
-        controller, loglines=loglines, thread_count=thread_count
+        controller, loglines=loglines, thread_count=thread_count, at_eof=at_eof
     )
 
     while True:
@@ -99,10 +103,11 @@ def process_loglines_to_overlay(
     loglines: Iterable[str],
     output_to_console: bool,
     thread_count: int,
+    at_eof: Callable[[], bool] | None = None,
 ) -> None:  # pragma: nocover
     """Process the state changes for each logline and output to an overlay"""
     get_stat_list = prepare_overlay(
-        controller, loglines=loglines, thread_count=thread_count
+        controller, loglines=loglines, thread_count=thread_count, at_eof=at_eof
     )
 
     if output_to_console:
@@ -157,12 +162,19 @@ def watch_from_logfile(
         fast_forward_state(controller, logfile.readlines())
         final_position = logfile.tell()
 
-    loglines = watch_file_with_reopen(logpath, start_at=final_position, blocking=True)
+    # Set when we have read all the lines in the file so far
+    at_eof = threading.Event()
+    loglines = watch_file_with_reopen(
+        logpath, start_at=final_position, blocking=True, at_eof=at_eof
+    )
 
     # Process the rest of the loglines as they come in
     if not overlay:
         process_loglines_to_stdout(
-            controller, loglines=loglines, thread_count=thread_count
+            controller,
+            loglines=loglines,
+            thread_count=thread_count,
+            at_eof=at_eof.is_set,
         )
     else:
         process_loglines_to_overlay(
@@ -170,6 +182,7 @@ def watch_from_logfile(
             loglines=loglines,
             output_to_console=console,
             thread_count=thread_count,
+            at_eof=at_eof.is_set,
         )
 
 
@@ -232,6 +245,12 @@ def setup(
     logger.debug(f"Running on {platform.uname()}. Python {platform.python_version()}")
     logger.setLevel(loglevel)
 
+    # Persist uuids between sessions to save requests to the Mojang api
+    try:
+        set_disk_uuid_cache(DiskUUIDCache(CACHE_DIR / "uuid_cache.sqlite"))
+    except sqlite3.Error as e:
+        logger.error(f"Failed opening the uuid cache '{e}'")
+
 
 def test() -> None:  # pragma: nocover
     """Test the implementation on a static logfile or a list of loglines"""
@@ -287,9 +306,13 @@ def test() -> None:  # pragma: nocover
         nick_database=nick_database,
     )
 
+    # Apply every line immediately when testing
+    def at_eof() -> bool:
+        return True
+
     if not overlay:
         process_loglines_to_stdout(
-            controller, loglines=loglines, thread_count=options.threads
+            controller, loglines=loglines, thread_count=options.threads, at_eof=at_eof
         )
     else:
         process_loglines_to_overlay(
@@ -297,6 +320,7 @@ def test() -> None:  # pragma: nocover
             loglines=loglines,
             output_to_console=console,
             thread_count=options.threads,
+            at_eof=at_eof,
         )
 
 
@@ -4,12 +4,12 @@ from enum import Enum, auto
 from json import JSONDecodeError
 from typing import Any
 
-import requests
 from cachetools import TTLCache
 from requests.exceptions import RequestException
 
 from examples.overlay.player import MISSING_WINSTREAKS, GamemodeName, Winstreaks
 from prism.ratelimiting import RateLimiter
+from prism.utils import REQUEST_TIMEOUT, make_session, send_ratelimited
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +51,8 @@ class AntiSniperAPIKeyHolder:
     ):
         self.key = key
         self.limiter = RateLimiter(limit=limit, window=window)
+        # Reuse connections to the api
+        self.session = make_session()
 
 
 def denick(
@@ -65,10 +67,14 @@ def denick(
 
     try:
         # Uphold our prescribed rate-limits
-        with key_holder.limiter:
-            response = requests.get(
-                f"{DENICK_ENDPOINT}?key={key_holder.key}&nick={nick}"
-            )
+        response = send_ratelimited(
+            key_holder.limiter,
+            lambda: key_holder.session.get(
+                DENICK_ENDPOINT,
+                params={"key": key_holder.key, "nick": nick},
+                timeout=REQUEST_TIMEOUT,
+            ),
+        )
     except RequestException as e:
         logger.error(f"Request to denick endpoint failed due to a connection error {e}")
         return set_denick_cache(nick, None)
@@ -125,10 +131,14 @@ def get_estimated_winstreaks(
     """Get the estimated winstreaks of the given uuid"""
     try:
         # Uphold our prescribed rate-limits
-        with key_holder.limiter:
-            response = requests.get(
-                f"{WINSTREAK_ENDPOINT}?key={key_holder.key}&uuid={uuid}"
-            )
+        response = send_ratelimited(
+            key_holder.limiter,
+            lambda: key_holder.session.get(
+                WINSTREAK_ENDPOINT,
+                params={"key": key_holder.key, "uuid": uuid},
+                timeout=REQUEST_TIMEOUT,
+            ),
+        )
     except RequestException as e:
         logger.error(
             f"Request to denick winstreak failed due to a connection error {e}"
@@ -227,10 +237,14 @@ def queue_data(
     """Get queue data about the given username/nick from the /antisniper API endpoint"""
     try:
         # Uphold our prescribed rate-limits
-        with key_holder.limiter:
-            response = requests.get(
-                f"{ANTISNIPER_ENDPOINT}?key={key_holder.key}&name={name}"
-            )
+        response = send_ratelimited(
+            key_holder.limiter,
+            lambda: key_holder.session.get(
+                ANTISNIPER_ENDPOINT,
+                params={"key": key_holder.key, "name": name},
+                timeout=REQUEST_TIMEOUT,
+            ),
+        )
     except RequestException as e:
         logger.error(
             f"Request to antisniper endpoint failed due to a connection error {e}"
@@ -1,17 +1,22 @@
 import functools
+import itertools
 import logging
 import queue
-from typing import Iterable
+from typing import Callable, Iterable, Sequence
 
 from examples.overlay.controller import OverlayController
+from examples.overlay.events import Event
 from examples.overlay.get_stats import get_bedwars_stats
 from examples.overlay.parsing import parse_logline
-from examples.overlay.player import MISSING_WINSTREAKS, KnownPlayer
+from examples.overlay.player import MISSING_WINSTREAKS, KnownPlayer, PlayerKind
 from examples.overlay.process_event import process_event
-from examples.overlay.settings import SettingsDict
+from examples.overlay.settings import NickValue, SettingsDict
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of events to process in one acquisition of the state mutex
+MAX_EVENT_BATCH_SIZE = 16
+
 
 def set_nickname(
     *, username: str | None, nick: str, controller: OverlayController
@@ -34,28 +39,30 @@ def set_nickname(
         old_nick = nick
 
     with controller.settings.mutex:
+        new_nick_value: NickValue | None
         if uuid is not None and username is not None:
-            # Search the known nicks in settings for the uuid
-            for old_nick, nick_value in controller.settings.known_nicks.items():
-                if uuid == nick_value["uuid"]:
-                    new_nick_value = nick_value
-                    break
+            # Look up the known nick in settings for the uuid
+            old_nick = controller.settings.uuid_to_nick.get(uuid, None)
+            if old_nick is not None:
+                new_nick_value = controller.settings.known_nicks[old_nick]
             else:
                 # Found no matching entries - make a new one
                 new_nick_value = {"uuid": uuid, "comment": username}
-                old_nick = None
         else:
             new_nick_value = None
 
         # Remove the old nick if found
         if old_nick is not None:
-            controller.settings.known_nicks.pop(old_nick, None)
+            controller.settings.remove_known_nick(old_nick)
 
         if new_nick_value is not None:
             # Add your new nick
-            controller.settings.known_nicks[nick] = new_nick_value
+            controller.settings.set_known_nick(nick, new_nick_value)
+
+        settings_snapshot = controller.settings.snapshot()
 
-        controller.store_settings()
+    # Write the snapshot to disk without blocking other readers of the settings
+    controller.store_settings(settings_snapshot)
 
     with controller.nick_database.mutex:
         # Delete your old nick if found
@@ -83,7 +90,9 @@ def set_hypixel_api_key(new_key: str, /, controller: OverlayController) -> None:
 
     with controller.settings.mutex:
         controller.settings.hypixel_api_key = new_key
-        controller.store_settings()
+        settings_snapshot = controller.settings.snapshot()
+
+    controller.store_settings(settings_snapshot)
 
     # Clear the stats cache in case the old api key was invalid
     controller.player_cache.clear_cache()
@@ -102,43 +111,75 @@ def fast_forward_state(controller: OverlayController, loglines: Iterable[str]) -
     logger.info("Done fast forwarding state")
 
 
-def process_loglines(loglines: Iterable[str], controller: OverlayController) -> None:
-    """Update state and set the redraw event"""
+def process_events_batch(
+    controller: OverlayController, events: Sequence[Event]
+) -> bool:
+    """Process the events in one acquisition of the mutex, return True if redraw"""
+    redraw = False
+    with controller.state.mutex:
+        for event in events:
+            redraw = process_event(controller, event) or redraw
+
+    return redraw
+
+
+def process_loglines(
+    loglines: Iterable[str],
+    controller: OverlayController,
+    max_batch_size: int = MAX_EVENT_BATCH_SIZE,
+    at_eof: Callable[[], bool] | None = None,
+) -> None:
+    """
+    Update state and set the redraw event
+
+    Events are processed in batches of at most `max_batch_size`.
+    If passed, `at_eof` is checked after each line. It should return True when no
+    more lines are available at the moment, which flushes the current batch.
+    """
+    events: list[Event] = []
+
     for line in loglines:
         event = parse_logline(line)
+        if event is not None:
+            events.append(event)
 
-        if event is None:
+        if not events:
             continue
 
-        with controller.state.mutex:
-            redraw = process_event(controller, event)
+        if len(events) < max_batch_size and (at_eof is None or not at_eof()):
+            continue
 
-        if redraw:
+        if process_events_batch(controller, events):
             # Tell the main thread we need a redraw
             controller.redraw_event.set()
 
+        events = []
+
+    if events and process_events_batch(controller, events):
+        controller.redraw_event.set()
+
 
 def should_redraw(
-    controller: OverlayController, completed_stats_queue: queue.Queue[str]
+    controller: OverlayController, completed_stats_queue: queue.SimpleQueue[str]
 ) -> bool:
     """Check if any updates happened since last time that needs a redraw"""
     # Check if the state update thread has issued any redraws since last time
     redraw = controller.redraw_event.is_set()
 
-    # Check if any of the stats downloaded since last render are still in the lobby
+    # Drain all the stats downloaded since last render
+    completed_usernames = set[str]()
     while True:
         try:
-            username = completed_stats_queue.get_nowait()
+            completed_usernames.add(completed_stats_queue.get_nowait())
         except queue.Empty:
             break
-        else:
-            completed_stats_queue.task_done()
-            if not redraw:
-                with controller.state.mutex:
-                    if username in controller.state.lobby_players:
-                        # We just received the stats of a player in the lobby
-                        # Redraw the screen in case the stats weren't there last time
-                        redraw = True
+
+    # Check if any of the stats downloaded since last render are still in the lobby
+    if not redraw and completed_usernames:
+        with controller.state.mutex:
+            # If we just received the stats of a player in the lobby, redraw the
+            # screen in case the stats weren't there last time
+            redraw = not controller.state.lobby_players.isdisjoint(completed_usernames)
 
     if redraw:
         # We are going to redraw - clear any redraw request
@@ -148,7 +189,9 @@ def should_redraw(
 
 
 def get_stats_and_winstreak(
-    username: str, completed_queue: queue.Queue[str], controller: OverlayController
+    username: str,
+    completed_queue: queue.SimpleQueue[str],
+    controller: OverlayController,
 ) -> None:
     """Get a username from the requests queue and cache their stats"""
     # get_bedwars_stats sets the stats cache which will be read from later
@@ -159,7 +202,7 @@ def get_stats_and_winstreak(
 
     logger.debug(f"Finished gettings stats for {username}")
 
-    if isinstance(player, KnownPlayer) and player.is_missing_winstreaks:
+    if player.kind is PlayerKind.KNOWN and player.is_missing_winstreaks:
         (
             estimated_winstreaks,
             winstreaks_accurate,
@@ -168,15 +211,14 @@ def get_stats_and_winstreak(
         if estimated_winstreaks is MISSING_WINSTREAKS:
             logger.debug(f"Updating missing winstreak for {username} failed")
         else:
-            for alias in player.aliases:
-                controller.player_cache.update_cached_player(
-                    alias,
-                    functools.partial(
-                        KnownPlayer.update_winstreaks,
-                        **estimated_winstreaks,
-                        winstreaks_accurate=winstreaks_accurate,
-                    ),
-                )
+            update_winstreaks = functools.partial(
+                KnownPlayer.update_winstreaks,
+                **estimated_winstreaks,
+                winstreaks_accurate=winstreaks_accurate,
+            )
+            controller.player_cache.update_cached_players(
+                player.aliases, update_winstreaks
+            )
 
             # Tell the main thread that we got the estimated winstreak
             completed_queue.put(username)
@@ -187,80 +229,87 @@ def update_settings(new_settings: SettingsDict, controller: OverlayController) -
     """
     Update the settings from the settings dict, with required side-effects
 
-    Caller must acquire lock on settings
+    Acquires the lock on settings. Does nothing if the settings are unchanged.
     """
-    logger.debug(f"Updating settings with {new_settings}")
-
-    hypixel_api_key_changed = (
-        new_settings["hypixel_api_key"] != controller.settings.hypixel_api_key
-    )
-
-    antisniper_api_key_changed = (
-        new_settings["antisniper_api_key"] != controller.settings.antisniper_api_key
-    )
-
-    use_antisniper_api_changed = (
-        new_settings["use_antisniper_api"] != controller.settings.use_antisniper_api
-    )
-
-    # True if the stats could be affected by the settings update
-    potential_antisniper_updates = (
-        # Changing their key and intending to use the api
-        antisniper_api_key_changed
-        and new_settings["use_antisniper_api"]
-    ) or (
-        # Turning the api on/off with an active key
-        use_antisniper_api_changed
-        and new_settings["antisniper_api_key"] is not None
-    )
-
-    # Known_nicks
-    def uuid_changed(nickname: str) -> bool:
-        """True if the uuid of the given nickname changed in new_settings"""
-        return (
-            new_settings["known_nicks"][nickname]
-            != controller.settings.known_nicks[nickname]
-        )
-
-    new_nicknames = set(new_settings["known_nicks"].keys())
-    old_nicknames = set(controller.settings.known_nicks.keys())
+    with controller.settings.mutex:
+        if new_settings == controller.settings.to_dict():
+            # Confirming the settings page without changes is common. The stored
+            # settings and the caches would be left as they are, so skip the disk
+            # write and the redraw.
+            logger.debug("Settings unchanged, skipping update")
+            return
 
-    added_nicknames = new_nicknames - old_nicknames
-    removed_nicknames = old_nicknames - new_nicknames
-    updated_nicknames = set(
-        filter(uuid_changed, set.intersection(new_nicknames, old_nicknames))
-    )
+        logger.debug(f"Updating settings with {new_settings}")
 
-    # Update the player cache
-    if hypixel_api_key_changed or potential_antisniper_updates:
-        logger.debug("Clearing whole player cache due to api key changes")
-        controller.player_cache.clear_cache()
-    else:
-        # Refetch stats for nicknames that had a player assigned or unassigned
-        # for nickname in added_nicknames + removed_nicknames:
-        for nickname in set.union(added_nicknames, removed_nicknames):
-            controller.player_cache.uncache_player(nickname)
-
-        # Refetch stats for nicknames that were assigned to a different player
-        for nickname in updated_nicknames:
-            controller.player_cache.uncache_player(nickname)
-
-    # Update default nick database
-    # NOTE: Since the caller must acquire the settings lock, we have two locks here
-    # Make sure that we always acquire the settings lock before the nick database lock
-    # to avoid deadlocks
-    with controller.nick_database.mutex:
-        for nickname in removed_nicknames:
-            controller.nick_database.default_database.pop(nickname, None)
+        hypixel_api_key_changed = (
+            new_settings["hypixel_api_key"] != controller.settings.hypixel_api_key
+        )
 
-        for nickname in set.union(added_nicknames, updated_nicknames):
-            controller.nick_database.default_database[nickname] = new_settings[
-                "known_nicks"
-            ][nickname]["uuid"]
+        antisniper_api_key_changed = (
+            new_settings["antisniper_api_key"] != controller.settings.antisniper_api_key
+        )
 
-    # Redraw the overlay to reflect changes in the stats cache/nicknames
-    controller.redraw_event.set()
+        use_antisniper_api_changed = (
+            new_settings["use_antisniper_api"] != controller.settings.use_antisniper_api
+        )
 
-    controller.settings.update_from(new_settings)
+        # True if the stats could be affected by the settings update
+        potential_antisniper_updates = (
+            # Changing their key and intending to use the api
+            antisniper_api_key_changed
+            and new_settings["use_antisniper_api"]
+        ) or (
+            # Turning the api on/off with an active key
+            use_antisniper_api_changed
+            and new_settings["antisniper_api_key"] is not None
+        )
 
-    controller.store_settings()
+        # Known_nicks
+        new_known_nicks = new_settings["known_nicks"]
+        old_known_nicks = controller.settings.known_nicks
+
+        added_nicknames = new_known_nicks.keys() - old_known_nicks.keys()
+        removed_nicknames = old_known_nicks.keys() - new_known_nicks.keys()
+        # Nicknames present in both, but whose value changed in new_settings
+        updated_nicknames = {
+            nickname
+            for nickname, nick_value in new_known_nicks.items()
+            if nickname in old_known_nicks and old_known_nicks[nickname] != nick_value
+        }
+
+        # Update the player cache
+        if hypixel_api_key_changed or potential_antisniper_updates:
+            logger.debug("Clearing whole player cache due to api key changes")
+            controller.player_cache.clear_cache()
+        elif added_nicknames or removed_nicknames or updated_nicknames:
+            # Refetch stats for nicknames that had a player assigned or unassigned,
+            # or that were assigned to a different player
+            controller.player_cache.uncache_players(
+                itertools.chain(added_nicknames, removed_nicknames, updated_nicknames)
+            )
+
+        # Update default nick database
+        # Build the new entries up front to keep the critical section short
+        new_default_entries = {
+            nickname: new_known_nicks[nickname]["uuid"]
+            for nickname in itertools.chain(added_nicknames, updated_nicknames)
+        }
+
+        # NOTE: Since we hold the settings lock, we have two locks here
+        # Make sure that we always acquire the settings lock before the nick
+        # database lock to avoid deadlocks
+        with controller.nick_database.mutex:
+            default_database = controller.nick_database.default_database
+            for nickname in removed_nicknames:
+                default_database.pop(nickname, None)
+
+            default_database.update(new_default_entries)
+
+        # Redraw the overlay to reflect changes in the stats cache/nicknames
+        controller.redraw_event.set()
+
+        controller.settings.update_from(new_settings)
+
+        settings_snapshot = controller.settings.snapshot()
+
+    controller.store_settings(settings_snapshot)
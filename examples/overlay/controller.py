@@ -18,7 +18,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from examples.overlay.nick_database import NickDatabase
     from examples.overlay.player import Winstreaks
     from examples.overlay.player_cache import PlayerCache
-    from examples.overlay.settings import Settings
+    from examples.overlay.settings import Settings, SettingsSnapshot
     from examples.overlay.state import OverlayState
 
 logger = logging.getLogger(__name__)
@@ -69,7 +69,7 @@ class OverlayController(Protocol):  # pragma: no cover
 
     @property
     @abstractmethod
-    def store_settings(self) -> Callable[[], None]:
+    def store_settings(self) -> Callable[[SettingsSnapshot], None]:
         raise NotImplementedError
 
 
@@ -159,5 +159,5 @@ class RealOverlayController:
 
         return get_estimated_winstreaks(uuid, self.antisniper_key_holder)
 
-    def store_settings(self) -> None:
-        self.settings.flush_to_disk()
+    def store_settings(self, snapshot: SettingsSnapshot) -> None:
+        self.settings.flush_to_disk(snapshot)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from enum import Enum, auto, unique
+from enum import Enum, IntEnum, auto, unique
 from typing import Literal, Union
 
 logger = logging.getLogger(__name__)
@@ -12,7 +12,7 @@ PartyRole = Literal["leader", "moderators", "members"]
 
 
 @unique
-class EventType(Enum):
+class EventType(IntEnum):
     # Initialization
     INITIALIZE_AS = auto()  # Initialize as the given username
 
@@ -48,24 +48,24 @@ class EventType(Enum):
     WHISPER_COMMAND_SET_NICK = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class InitializeAsEvent:
     username: str
     event_type: Literal[EventType.INITIALIZE_AS] = EventType.INITIALIZE_AS
 
 
-@dataclass
+@dataclass(slots=True)
 class NewNicknameEvent:
     nick: str
     event_type: Literal[EventType.NEW_NICKNAME] = EventType.NEW_NICKNAME
 
 
-@dataclass
+@dataclass(slots=True)
 class LobbySwapEvent:
     event_type: Literal[EventType.LOBBY_SWAP] = EventType.LOBBY_SWAP
 
 
-@dataclass
+@dataclass(slots=True)
 class LobbyJoinEvent:
     username: str
     player_count: int
@@ -73,64 +73,64 @@ class LobbyJoinEvent:
     event_type: Literal[EventType.LOBBY_JOIN] = EventType.LOBBY_JOIN
 
 
-@dataclass
+@dataclass(slots=True)
 class LobbyLeaveEvent:
     username: str
     event_type: Literal[EventType.LOBBY_LEAVE] = EventType.LOBBY_LEAVE
 
 
-@dataclass
+@dataclass(slots=True)
 class LobbyListEvent:
     usernames: list[str]
     event_type: Literal[EventType.LOBBY_LIST] = EventType.LOBBY_LIST
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyAttachEvent:
     username: str  # Leader
     event_type: Literal[EventType.PARTY_ATTACH] = EventType.PARTY_ATTACH
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyDetachEvent:
     event_type: Literal[EventType.PARTY_DETACH] = EventType.PARTY_DETACH
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyJoinEvent:
     usernames: list[str]
     event_type: Literal[EventType.PARTY_JOIN] = EventType.PARTY_JOIN
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyLeaveEvent:
     usernames: list[str]
     event_type: Literal[EventType.PARTY_LEAVE] = EventType.PARTY_LEAVE
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyListIncomingEvent:
     event_type: Literal[EventType.PARTY_LIST_INCOMING] = EventType.PARTY_LIST_INCOMING
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyMembershipListEvent:
     usernames: list[str]
     role: PartyRole  # The users' roles
     event_type: Literal[EventType.PARTY_ROLE_LIST] = EventType.PARTY_ROLE_LIST
 
 
-@dataclass
+@dataclass(slots=True)
 class StartBedwarsGameEvent:
     event_type: Literal[EventType.START_BEDWARS_GAME] = EventType.START_BEDWARS_GAME
 
 
-@dataclass
+@dataclass(slots=True)
 class EndBedwarsGameEvent:
     event_type: Literal[EventType.END_BEDWARS_GAME] = EventType.END_BEDWARS_GAME
 
 
-@dataclass
+@dataclass(slots=True)
 class NewAPIKeyEvent:
     key: str
     event_type: Literal[EventType.NEW_API_KEY] = EventType.NEW_API_KEY
@@ -141,7 +141,7 @@ class WhisperCommandType(Enum):
     SET_NICK = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class WhisperCommandSetNickEvent:
     nick: str
     username: str | None
@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 import time
 from collections.abc import Iterable
 from datetime import date, datetime
@@ -17,6 +18,7 @@ def watch_file_with_reopen(
     blocking: Literal[False],
     reopen_timeout: float = ...,
     poll_timeout: float = ...,
+    at_eof: threading.Event | None = ...,
 ) -> Iterable[str | None]:  # pragma: nocover
     ...
 
@@ -29,6 +31,7 @@ def watch_file_with_reopen(
     blocking: Literal[True],
     reopen_timeout: float = ...,
     poll_timeout: float = ...,
+    at_eof: threading.Event | None = ...,
 ) -> Iterable[str]:  # pragma: nocover
     ...
 
@@ -40,6 +43,7 @@ def watch_file_with_reopen(
     blocking: bool,
     reopen_timeout: float = 30,
     poll_timeout: float = 0.1,
+    at_eof: threading.Event | None = None,
 ) -> Iterable[str | None]:
     """
     Iterate over new lines in a file, reopen the file when stale
@@ -49,6 +53,8 @@ def watch_file_with_reopen(
     Read again if more than `poll_timeout` seconds have passed since last read
     If `blocking` is True the function will poll until a new line is read
     If `blocking is False the function will `yield None` for every failed read
+    If passed, `at_eof` is set while yielding the last line currently in the file,
+    and cleared while yielding any other line
     """
 
     last_position = start_at
@@ -69,10 +75,19 @@ def watch_file_with_reopen(
                 # and seek to where we left off
                 f.seek(last_position, os.SEEK_SET)
 
+            # True if we have read any lines since the last time we reached the end
+            read_since_last_poll = False
+
+            line = f.readline()
             while True:
-                line = f.readline()
-                last_position = f.tell()
                 if not line:
+                    # Only check the time and position when we run out of lines, to
+                    # avoid doing so for every line when reading a lot of lines
+                    last_position = f.tell()
+                    if read_since_last_poll:
+                        last_read = time.monotonic()
+                        read_since_last_poll = False
+
                     # No new lines -> wait
                     time_since_last_read = time.monotonic() - last_read
                     new_day = date.today() != date_openend
@@ -97,7 +112,18 @@ def watch_file_with_reopen(
                     if not blocking:
                         yield None
                     time.sleep(poll_timeout)
+                    line = f.readline()
                     continue
 
-                last_read = time.monotonic()
+                read_since_last_poll = True
+
+                # Read one line ahead to know if this is the last line for now
+                next_line = f.readline()
+                if at_eof is not None:
+                    if not next_line:
+                        at_eof.set()
+                    elif at_eof.is_set():
+                        at_eof.clear()
+
                 yield line
+                line = next_line
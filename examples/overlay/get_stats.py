@@ -1,11 +1,12 @@
 import logging
+from collections.abc import Callable
 from dataclasses import replace
 
 from examples.overlay.controller import OverlayController
 from examples.overlay.player import (
     KnownPlayer,
     NickedPlayer,
-    PendingPlayer,
+    PlayerKind,
     create_known_player,
 )
 
@@ -14,26 +15,21 @@ logger = logging.getLogger(__name__)
 
 def denick(nick: str, controller: OverlayController) -> str | None:
     """Try denicking via the antisniper API, fallback to dict"""
-    uuid = controller.nick_database.get_default(nick)
-
-    # Return if the user has specified a denick
-    if uuid is not None:
-        logger.debug(f"Denicked with default database {nick} -> {uuid}")
-        return uuid
-
-    uuid = controller.denick(nick)
-
-    if uuid is not None:
-        logger.debug(f"Denicked with api {nick} -> {uuid}")
-        return uuid
+    # In order of priority. The default database holds the user's own denicks
+    denick_sources: tuple[tuple[str, Callable[[str], str | None]], ...] = (
+        ("default database", controller.nick_database.get_default),
+        ("api", controller.denick),
+        ("database", controller.nick_database.get),
+    )
 
-    uuid = controller.nick_database.get(nick)
+    for source_name, get_uuid in denick_sources:
+        uuid = get_uuid(nick)
 
-    if uuid is not None:
-        logger.debug(f"Denicked with database {nick} -> {uuid}")
-        return uuid
+        if uuid is not None:
+            logger.debug("Denicked with %s %s -> %s", source_name, nick, uuid)
+            return uuid
 
-    logger.debug(f"Failed denicking {nick}")
+    logger.debug("Failed denicking %s", nick)
 
     return None
 
@@ -42,11 +38,19 @@ def fetch_bedwars_stats(
     username: str, controller: OverlayController
 ) -> KnownPlayer | NickedPlayer:
     """Fetches the bedwars stats for the given player"""
-    uuid = controller.get_uuid(username)
-
-    # Look up in nick database if we got no match from Mojang
     nick: str | None = None
     denicked = False
+
+    # Denicks specified by the user take precedence - skip Mojang for those
+    uuid = controller.nick_database.get_default(username)
+    if uuid is not None:
+        nick = username
+        denicked = True
+        logger.debug(f"De-nicked {username} as {uuid} with default database")
+    else:
+        uuid = controller.get_uuid(username)
+
+    # Look up in nick database if we got no match from Mojang
     if uuid is None:
         denick_result = denick(username, controller)
         if denick_result is not None:
@@ -96,7 +100,7 @@ def get_bedwars_stats(
     """Get and caches the bedwars stats for the given player"""
     cached_stats = controller.player_cache.get_cached_player(username)
 
-    if cached_stats is not None and not isinstance(cached_stats, PendingPlayer):
+    if cached_stats is not None and cached_stats.kind is not PlayerKind.PENDING:
         logger.debug(f"Cache hit {username}")
 
         return cached_stats
@@ -105,7 +109,7 @@ def get_bedwars_stats(
 
     player = fetch_bedwars_stats(username, controller)
 
-    if isinstance(player, KnownPlayer) and player.nick is not None:
+    if player.kind is PlayerKind.KNOWN and player.nick is not None:
         # If we look up by actual username, that means the user is not nicked
         controller.player_cache.set_cached_player(
             player.username, replace(player, nick=None)
@@ -1,5 +1,6 @@
 import tkinter as tk
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Generic
 
 from examples.overlay.output.overlay.utils import (
@@ -12,9 +13,36 @@ from examples.overlay.output.overlay.utils import (
 if TYPE_CHECKING:  # pragma: nocover
     from examples.overlay.output.overlay.stats_overlay import StatsOverlay
 
-StatsCells = dict[ColumnKey, Cell]
 
-OverlayRow = tuple[tk.Button, StatsCells[ColumnKey]]
+@dataclass(eq=False)
+class OverlayRow:  # pragma: nocover
+    """A row in the table consisting of an edit button and a cell per column"""
+
+    key: str  # The text in the key column identifying the row
+    row_index: int  # The grid row the widgets are placed in
+    edit_button: tk.Button
+    # One cell per column, in the same order as the column order of the table
+    stats_cells: tuple[Cell, ...]
+    # The nickname the edit button is currently set up for
+    nickname: str | None = None
+
+    def move_to(self, row_index: int) -> None:
+        """Move the widgets of the row to the given grid row"""
+        if row_index == self.row_index:
+            return
+
+        self.edit_button.grid_configure(row=row_index)
+        for cell in self.stats_cells:
+            cell.label.grid_configure(row=row_index)
+
+        self.row_index = row_index
+
+    def destroy(self) -> None:
+        """Destroy the widgets of the row"""
+        for cell in self.stats_cells:
+            cell.label.destroy()
+
+        self.edit_button.destroy()
 
 
 class MainContent(Generic[ColumnKey]):  # pragma: nocover
@@ -25,26 +53,44 @@ class MainContent(Generic[ColumnKey]):  # pragma: nocover
         parent: tk.Misc,
         overlay: "StatsOverlay[ColumnKey]",
         column_order: Sequence[ColumnKey],
-        column_names: dict[ColumnKey, str],
+        column_names: Mapping[ColumnKey, str],
         left_justified_columns: set[int],
+        key_column: ColumnKey,
     ) -> None:
         # Column config
-        """Set up a frame containing the main content for the overlay"""
+        """
+        Set up a frame containing the main content for the overlay
+
+        The text in `key_column` identifies a row, so that the widgets of a row can be
+        reused when it moves in the table.
+        """
         self.overlay = overlay
-        self.column_order = column_order
+        self.column_order = tuple(column_order)
         self.column_names = column_names
         self.left_justified_columns = left_justified_columns
+        self.key_column = key_column
+
+        # Justification and grid sticky side of each column
+        self.column_justify: tuple[Callable[[str, int], str], ...] = tuple(
+            str.ljust if column_index in left_justified_columns else str.rjust
+            for column_index in range(len(self.column_order))
+        )
+        self.column_sticky: tuple[str, ...] = tuple(
+            "w" if column_index in left_justified_columns else "e"
+            for column_index in range(len(self.column_order))
+        )
 
         self.frame = tk.Frame(parent, background="black")
 
         # Start with zero rows
-        self.rows: list[OverlayRow[ColumnKey]] = []
+        self.rows: list[OverlayRow] = []
 
         # Frame at the top to display info to the user
         self.info_frame = tk.Frame(self.frame, background="black")
         self.info_frame.pack(side=tk.TOP, expand=True, fill=tk.X)
 
-        self.info_labels: dict[CellValue, tk.Label] = {}
+        # The label and current color of each info cell, keyed by the text
+        self.info_labels: dict[str, tuple[tk.Label, str]] = {}
 
         def shrink_info_when_empty(event: "tk.Event[tk.Frame]") -> None:
             """Manually shrink the info frame when it becomes empty"""
@@ -61,27 +107,21 @@ class MainContent(Generic[ColumnKey]):  # pragma: nocover
         for column_index, column_name in enumerate(self.column_order):
             header_label = tk.Label(
                 self.table_frame,
-                text=(
-                    str.ljust
-                    if column_index in self.left_justified_columns
-                    else str.rjust
-                )(self.column_names[column_name], 7),
+                text=self.column_justify[column_index](
+                    self.column_names[column_name], 7
+                ),
                 font=("Consolas", "14"),
                 fg="snow",
                 bg="black",
             )
             header_label.grid(
-                row=1,
-                column=column_index + 1,
-                sticky="w" if column_index in self.left_justified_columns else "e",
+                row=1, column=column_index + 1, sticky=self.column_sticky[column_index]
             )
 
-    def append_row(self) -> None:
-        """Add a row of labels and stringvars to the table"""
-        row_index = len(self.rows) + 2
-
-        stats_cells: StatsCells[ColumnKey] = {}
-        for column_index, column_name in enumerate(self.column_order):
+    def create_row(self, key: str, row_index: int) -> OverlayRow:
+        """Create a row of labels and stringvars in the given grid row"""
+        stats_cells: list[Cell] = []
+        for column_index, sticky in enumerate(self.column_sticky):
             string_var = tk.StringVar()
             label = tk.Label(
                 self.table_frame,
@@ -90,12 +130,8 @@ class MainContent(Generic[ColumnKey]):  # pragma: nocover
                 bg="black",
                 textvariable=string_var,
             )
-            label.grid(
-                row=row_index,
-                column=column_index + 1,
-                sticky="w" if column_index in self.left_justified_columns else "e",
-            )
-            stats_cells[column_name] = Cell(label, string_var)
+            label.grid(row=row_index, column=column_index + 1, sticky=sticky)
+            stats_cells.append(Cell(label, string_var))
 
         edit_button = tk.Button(
             self.table_frame,
@@ -111,47 +147,39 @@ class MainContent(Generic[ColumnKey]):  # pragma: nocover
         )
         edit_button.grid(row=row_index, column=0)
 
-        self.rows.append((edit_button, stats_cells))
-
-    def pop_row(self) -> None:
-        """Remove a row of labels and stringvars from the table"""
-        edit_button, stats_cells = self.rows.pop()
-        for column_name in self.column_order:
-            stats_cells[column_name].label.destroy()
-
-        edit_button.destroy()
-
-    def set_length(self, length: int) -> None:
-        """Add or remove table rows to give the desired length"""
-        current_length = len(self.rows)
-        if length > current_length:
-            for i in range(length - current_length):
-                self.append_row()
-        elif length < current_length:
-            for i in range(current_length - length):
-                self.pop_row()
+        return OverlayRow(key, row_index, edit_button, tuple(stats_cells))
 
     def update_info(self, info_cells: list[CellValue]) -> None:
         """Update the list of info cells at the top of the overlay"""
-        to_remove = set(self.info_labels.keys()) - set(info_cells)
-        to_add = set(info_cells) - set(self.info_labels.keys())
+        # Info cells are identified by their text. Only the color is updated in place
+        new_colors = {cell.text: cell.color for cell in info_cells}
+
+        to_remove = self.info_labels.keys() - new_colors.keys()
 
         # Remove old labels
-        for cell in to_remove:
-            label = self.info_labels.pop(cell)
+        for text in to_remove:
+            label, _ = self.info_labels.pop(text)
             label.destroy()
 
-        # Add new labels
-        for cell in to_add:
+        for text, color in new_colors.items():
+            if text in self.info_labels:
+                # Update the color of existing labels
+                label, last_color = self.info_labels[text]
+                if color != last_color:
+                    label.configure(fg=color)
+                    self.info_labels[text] = (label, color)
+                continue
+
+            # Add new labels
             label = tk.Label(
                 self.info_frame,
-                text=cell.text,
+                text=text,
                 font=("Consolas", "14"),
-                fg=cell.color,  # Color set on each update
+                fg=color,
                 bg="black",
             )
             label.pack(side=tk.TOP)
-            self.info_labels[cell] = label
+            self.info_labels[text] = (label, color)
 
     def update_content(
         self,
@@ -164,22 +192,45 @@ class MainContent(Generic[ColumnKey]):  # pragma: nocover
 
         # Set the contents of the table if new data was provided
         if new_rows is not None:
-            self.set_length(len(new_rows))
+            column_order = self.column_order
+            key_column = self.key_column
+            old_rows = self.rows
+            # Rows that can be reused, keyed by their identity
+            available_rows = {row.key: row for row in old_rows}
 
+            self.rows = []
             for i, (nickname, rated_stats) in enumerate(new_rows):
-                edit_button, stats_cells = self.rows[i]
-                for column_name in self.column_order:
-                    stats_cells[column_name].variable.set(rated_stats[column_name].text)
-                    stats_cells[column_name].label.configure(
-                        fg=rated_stats[column_name].color
-                    )
+                key = rated_stats[key_column].text
+                row_index = i + 2  # The header is in row 1
+
+                row = available_rows.pop(key, None)
+                if row is None:
+                    row = self.create_row(key, row_index)
+                else:
+                    row.move_to(row_index)
+
+                self.rows.append(row)
+
+                # Only cells with new values are updated
+                for cell, column_name in zip(row.stats_cells, column_order):
+                    cell.set_value(rated_stats[column_name])
+
+                if nickname == row.nickname:
+                    continue
 
                 if nickname is None:
-                    edit_button.configure(state="disabled", command=lambda: None)
+                    row.edit_button.configure(state="disabled", command=lambda: None)
                 else:
-                    edit_button.configure(
+                    row.edit_button.configure(
                         state="normal", command=self.make_set_nick_callback(nickname)
                     )
+                row.nickname = nickname
+
+            # Remove the rows that were not reused
+            used_rows = set(self.rows)
+            for row in old_rows:
+                if row not in used_rows:
+                    row.destroy()
 
     def make_set_nick_callback(self, nickname: str) -> Callable[[], None]:
         """Create a callback to pass as a command to open the set nick page"""
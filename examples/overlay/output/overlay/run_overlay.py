@@ -55,6 +55,7 @@ def run_overlay(
         column_order=COLUMN_ORDER,
         column_names=COLUMN_NAMES,
         left_justified_columns={0},
+        key_column="username",
         controller=controller,
         get_new_data=get_new_data,
         poll_interval=100,
@@ -284,8 +284,7 @@ class SettingsPage:  # pragma: nocover
             show_on_tab=show_on_tab
         )
 
-        with self.controller.settings.mutex:
-            update_settings(new_settings, self.controller)
+        update_settings(new_settings, self.controller)
 
         # Go back to the main content
         self.overlay.switch_page("main")
@@ -1,6 +1,6 @@
 import logging
 import tkinter as tk
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import Generic, Literal
 
 import pynput
@@ -26,8 +26,9 @@ class StatsOverlay(Generic[ColumnKey]):  # pragma: nocover
         self,
         start_hidden: bool,
         column_order: Sequence[ColumnKey],
-        column_names: dict[ColumnKey, str],
+        column_names: Mapping[ColumnKey, str],
         left_justified_columns: set[int],
+        key_column: ColumnKey,
         controller: OverlayController,
         get_new_data: Callable[
             [], tuple[bool, list[CellValue], list[OverlayRowData[ColumnKey]] | None]
@@ -72,6 +73,7 @@ class StatsOverlay(Generic[ColumnKey]):  # pragma: nocover
             column_order=column_order,
             column_names=column_names,
             left_justified_columns=left_justified_columns,
+            key_column=key_column,
         )
         self.main_content.frame.pack(side=tk.TOP, fill=tk.BOTH)
 
@@ -2,21 +2,34 @@ import tkinter as tk
 from dataclasses import dataclass
 from typing import TypeVar
 
-from examples.overlay.output.utils import STAT_LEVELS, rate_value
-from examples.overlay.player import KnownPlayer, NickedPlayer, Player, PropertyName
+from examples.overlay.output.utils import STAT_LEVELS_ITEMS, rate_value
+from examples.overlay.player import Player, PlayerKind, PropertyName
 
 ColumnKey = TypeVar("ColumnKey")
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """A cell in the window described by one label and one stringvar"""
 
     label: tk.Label
     variable: tk.StringVar
+    # The last values written to the cell, used to skip redundant updates
+    last_text: str | None = None
+    last_color: str | None = None
 
+    def set_value(self, value: "CellValue") -> None:
+        """Set the text and color of the cell, skipping unchanged values"""
+        if value.text != self.last_text:
+            self.variable.set(value.text)
+            self.last_text = value.text
 
-@dataclass(frozen=True)
+        if value.color != self.last_color:
+            self.label.configure(fg=value.color)
+            self.last_color = value.color
+
+
+@dataclass(frozen=True, slots=True)
 class CellValue:
     """A value that can be set to a cell in the window"""
 
@@ -39,7 +52,7 @@ LEVEL_COLORMAP = (
     "red",
 )
 
-for levels in STAT_LEVELS.values():
+for _, levels in STAT_LEVELS_ITEMS:
     if levels is not None:
         assert len(levels) <= len(LEVEL_COLORMAP) - 1
 
@@ -51,8 +64,8 @@ def player_to_row(player: Player) -> OverlayRowData[PropertyName]:
     Gets the text from player.get_string
     Gets the color by rating the stats
     """
-    if isinstance(player, NickedPlayer) or (
-        isinstance(player, KnownPlayer) and player.nick is not None
+    if player.kind is PlayerKind.NICKED or (
+        player.kind is PlayerKind.KNOWN and player.nick is not None
     ):
         nickname = player.nick
     else:
@@ -68,5 +81,5 @@ def player_to_row(player: Player) -> OverlayRowData[PropertyName]:
                 else DEFAULT_COLOR
             ),
         )
-        for name, levels in STAT_LEVELS.items()
+        for name, levels in STAT_LEVELS_ITEMS
     }
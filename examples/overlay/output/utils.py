@@ -1,25 +1,35 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 from typing import cast
 
 from examples.overlay.player import PropertyName
 
-COLUMN_NAMES: dict[PropertyName, str] = {
-    "rank": "Rank",
-    "username": "IGN (Nick)",
-    "stars": "Stars",
-    "fkdr": "FKDR",
-    "wlr": "WLR",
-    "winstreak": "WS",
-}
-
-STAT_LEVELS: dict[PropertyName, Sequence[float] | None] = {
-    "stars": (100, 300, 500, 800),
-    "fkdr": (1, 2, 4, 8),
-    "wlr": (0.3, 1, 2, 4),
-    "winstreak": (5, 15, 30, 50),
-    "username": None,
-    "rank": None,
-}
+COLUMN_NAMES: Mapping[PropertyName, str] = MappingProxyType(
+    {
+        "rank": "Rank",
+        "username": "IGN (Nick)",
+        "stars": "Stars",
+        "fkdr": "FKDR",
+        "wlr": "WLR",
+        "winstreak": "WS",
+    }
+)
+
+STAT_LEVELS: Mapping[PropertyName, Sequence[float] | None] = MappingProxyType(
+    {
+        "stars": (100, 300, 500, 800),
+        "fkdr": (1, 2, 4, 8),
+        "wlr": (0.3, 1, 2, 4),
+        "winstreak": (5, 15, 30, 50),
+        "username": None,
+        "rank": None,
+    }
+)
+
+# The items of STAT_LEVELS, for consumers that iterate over every stat
+STAT_LEVELS_ITEMS: tuple[tuple[PropertyName, Sequence[float] | None], ...] = tuple(
+    STAT_LEVELS.items()
+)
 
 
 # The included columns in order
@@ -29,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 
 RANK_REGEX = re.compile(r"\[[a-zA-Z\+]+\] ")
+LOBBY_FILL_REGEX = re.compile(r"\(\d+\/\d+\)\!")
 
 
 CLIENT_INFO_PREFIXES = (
@@ -44,6 +45,14 @@ CHAT_PREFIXES = (
     "[Client thread/INFO]: [CHAT] ",  # Vanilla and forge latest.log + Lunar client
 )
 
+# Matches if the line contains any of the prefixes above
+ANY_PREFIX_REGEX = re.compile(
+    "|".join(map(re.escape, dict.fromkeys(CLIENT_INFO_PREFIXES + CHAT_PREFIXES)))
+)
+
+# Chat message sent when the user runs /api new
+NEW_API_KEY_PREFIX = "Your new API key is "
+
 
 def strip_until(line: str, *, until: str) -> str:
     """Remove the first occurrence of `until` and all characters before"""
@@ -94,6 +103,10 @@ def get_highest_index(source: str, *strings: str) -> str | None:
 def parse_logline(logline: str) -> Event | None:
     """Parse a log line to detect players leaving or joining the lobby/party"""
 
+    # Most lines don't contain any of the prefixes -> reject them in a single search
+    if ANY_PREFIX_REGEX.search(logline) is None:
+        return None
+
     # Get the lowest index of any of the chat prefixes to find the message
     # This prevents users being able to inject a payload by typing a message
     # starting with the log prefix
@@ -105,10 +118,11 @@ def parse_logline(logline: str) -> Event | None:
     # user controlled, and we are safe to not use the lowest index.
     # Instead we use the highest index as some prefixes share a prefix.
     client_info_prefix = get_highest_index(logline, *CLIENT_INFO_PREFIXES)
-    if client_info_prefix is not None:
-        return parse_client_info(strip_until(logline, until=client_info_prefix))
+    if client_info_prefix is None:  # pragma: nocover
+        # Not reached, as the line matched one of the prefixes in ANY_PREFIX_REGEX
+        return None
 
-    return None
+    return parse_client_info(strip_until(logline, until=client_info_prefix))
 
 
 def parse_client_info(info: str) -> ClientEvent | None:
@@ -151,7 +165,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         players = message.removeprefix(WHO_PREFIX).split(", ")
         return LobbyListEvent(players)
 
-    if message.startswith("Your new API key is "):
+    if message.startswith(NEW_API_KEY_PREFIX):
         # Info [CHAT] Your new API key is deadbeef-ae10-4d07-25f6-f23130b92652
         logger.debug("Processing potential new API key")
         words = message.split(" ")
@@ -210,7 +224,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         username = words[0]
 
         lobby_fill_string = words[3]
-        if not re.fullmatch(r"\(\d+\/\d+\)\!", lobby_fill_string):
+        if not LOBBY_FILL_REGEX.fullmatch(lobby_fill_string):
             logger.debug(f"Fill string '{lobby_fill_string}' does not match '(x/N)!'")
             return None
 
@@ -1,8 +1,11 @@
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field, replace
-from typing import Any, Literal, TypedDict, overload
+from enum import IntEnum, auto, unique
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, ClassVar, Literal, TypedDict, overload
 
 from prism.calc import bedwars_level_from_exp
 from prism.playerdata import MissingStatsError, get_gamemode_stats
@@ -11,11 +14,11 @@ from prism.utils import div, truncate_float
 GamemodeName = Literal["overall", "solo", "doubles", "threes", "fours"]
 
 StatName = Literal["stars", "fkdr", "wlr", "winstreak"]
-InfoName = Literal["username"]
+InfoName = Literal["username", "rank"]
 PropertyName = Literal[StatName, InfoName]
 
 StatsOrder = tuple[float, int, float]
-KnownPlayerOrder = tuple[StatsOrder, float, str]
+KnownPlayerOrder = tuple[float, StatsOrder, float, str]
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,15 @@ MISSING_WINSTREAKS = Winstreaks(
 )
 
 
+@unique
+class PlayerKind(IntEnum):
+    """Tag identifying the kind of a Player"""
+
+    KNOWN = auto()
+    NICKED = auto()
+    PENDING = auto()
+
+
 @dataclass(frozen=True, slots=True)
 class Stats:
     """Dataclass holding a collection of stats"""
@@ -66,6 +78,8 @@ class Stats:
 class KnownPlayer:
     """Dataclass holding the stats of a single player"""
 
+    kind: ClassVar[Literal[PlayerKind.KNOWN]] = PlayerKind.KNOWN
+
     stats: Stats
     stars: float
     username: str
@@ -105,34 +119,11 @@ class KnownPlayer:
 
     def get_value(self, name: PropertyName) -> str | int | float | None:
         """Get the given stat from this player"""
-        if name == "fkdr":
-            return self.stats.fkdr
-        elif name == "stars":
-            return self.stars
-        elif name == "wlr":
-            return self.stats.wlr
-        elif name == "winstreak":
-            return self.stats.winstreak
-        elif name == "username":
-            return self.username + (f" ({self.nick})" if self.nick is not None else "")
-        elif name == "rank":
-            return self.rank
+        return KNOWN_PLAYER_GETTERS[name](self)
 
     def get_string(self, name: PropertyName) -> str:
         """Get a string representation of the given stat"""
-        value = self.get_value(name)
-        if value is None:
-            return "-"
-        elif name == "winstreak":
-            return f"{value}{'' if self.stats.winstreak_accurate else '?'}"
-        elif isinstance(value, int):
-            return str(value)
-        elif isinstance(value, str):
-            return value
-        elif isinstance(value, float):
-            return truncate_float(value, 2)
-        else:  # pragma: nocover
-            raise ValueError(f"{name=} {value=}")
+        return KNOWN_PLAYER_FORMATTERS[name](self)
 
     def update_winstreaks(
         self,
@@ -152,10 +143,63 @@ class KnownPlayer:
         )
 
 
+def _get_display_username(player: KnownPlayer) -> str:
+    """Get the username of the player, with their nick appended if known"""
+    if player.nick is None:
+        return player.username
+    return f"{player.username} ({player.nick})"
+
+
+# Getters for the properties of a KnownPlayer, looked up once per rendered cell
+KNOWN_PLAYER_GETTERS: Mapping[
+    PropertyName, Callable[[KnownPlayer], str | int | float | None]
+]
+KNOWN_PLAYER_GETTERS = MappingProxyType(
+    {
+        "fkdr": attrgetter("stats.fkdr"),
+        "stars": attrgetter("stars"),
+        "wlr": attrgetter("stats.wlr"),
+        "winstreak": attrgetter("stats.winstreak"),
+        "username": _get_display_username,
+        "rank": attrgetter("rank"),
+    }
+)
+
+
+def _format_number(value: int | float) -> str:
+    """Format an int as is, and a float with two decimals rounded down"""
+    if isinstance(value, int):
+        return str(value)
+    return truncate_float(value, 2)
+
+
+def _format_winstreak(player: KnownPlayer) -> str:
+    """Format the winstreak of the player, marking it if it is inaccurate"""
+    if player.stats.winstreak is None:
+        return "-"
+    return f"{player.stats.winstreak}{'' if player.stats.winstreak_accurate else '?'}"
+
+
+# Formatters for the properties of a KnownPlayer, used by get_string
+KNOWN_PLAYER_FORMATTERS: Mapping[PropertyName, Callable[[KnownPlayer], str]]
+KNOWN_PLAYER_FORMATTERS = MappingProxyType(
+    {
+        "fkdr": lambda player: _format_number(player.stats.fkdr),
+        "stars": lambda player: _format_number(player.stars),
+        "wlr": lambda player: _format_number(player.stats.wlr),
+        "winstreak": _format_winstreak,
+        "username": _get_display_username,
+        "rank": attrgetter("rank"),
+    }
+)
+
+
 @dataclass(frozen=True, slots=True)
 class NickedPlayer:
     """Dataclass holding the stats of a single player assumed to be nicked"""
 
+    kind: ClassVar[Literal[PlayerKind.NICKED]] = PlayerKind.NICKED
+
     nick: str
 
     @property
@@ -189,6 +233,8 @@ class NickedPlayer:
 class PendingPlayer:
     """Dataclass holding the stats of a single player whose stats are pending"""
 
+    kind: ClassVar[Literal[PlayerKind.PENDING]] = PlayerKind.PENDING
+
     username: str
 
     @property
@@ -225,19 +271,10 @@ def rate_player(
     def rate_stats(player: Player) -> RatePlayerReturn:
         """Used as a key function for sorting"""
         is_enemy = player.username not in party_members
-        if not isinstance(player, KnownPlayer):
-            # Hack to compare other Player instances by username only
-            order = KnownPlayer(
-                username=player.username,
-                uuid="placeholder",
-                stars=0,
-                stats=Stats(
-                    fkdr=0,
-                    wlr=0,
-                    winstreak=0,
-                    winstreak_accurate=True,
-                ),
-            ).order()
+        if player.kind is not PlayerKind.KNOWN:
+            # Compare other Player instances by username only, as if they had no
+            # stats. Same as the order of a KnownPlayer with all stats set to 0
+            order = (0, (0, 0, 0), 0, player.username)
             return (is_enemy, player.stats_hidden, order)
 
         return (is_enemy, player.stats_hidden, player.order())
@@ -1,10 +1,16 @@
 import logging
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from cachetools import TTLCache
 
-from examples.overlay.player import KnownPlayer, NickedPlayer, PendingPlayer, Player
+from examples.overlay.player import (
+    KnownPlayer,
+    NickedPlayer,
+    PendingPlayer,
+    Player,
+    PlayerKind,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +20,8 @@ class PlayerCache:
         # Entries cached for 2mins, so they hopefully expire before the next queue
         self._cache = TTLCache[str, Player](maxsize=512, ttl=120)
         self._mutex = threading.Lock()
+        # Incremented every time the contents of the cache change
+        self._epoch = 0
 
     def set_player_pending(self, username: str) -> PendingPlayer:
         """Note that this user is pending"""
@@ -24,6 +32,7 @@ class PlayerCache:
                 logger.error(f"Player {username} set to pending, but already exists")
 
             self._cache[username] = pending_player
+            self._epoch += 1
 
         return pending_player
 
@@ -32,6 +41,7 @@ class PlayerCache:
     ) -> None:
         with self._mutex:
             self._cache[username] = player
+            self._epoch += 1
 
     def get_cached_player(self, username: str) -> Player | None:
         with self._mutex:
@@ -41,19 +51,60 @@ class PlayerCache:
         self, username: str, update: Callable[[KnownPlayer], KnownPlayer]
     ) -> None:
         """Update the cache for a player"""
+        self.update_cached_players((username,), update)
+
+    def update_cached_players(
+        self, usernames: Iterable[str], update: Callable[[KnownPlayer], KnownPlayer]
+    ) -> None:
+        """Update the cache for all the `usernames` in one critical section"""
+        missing_usernames: list[str] = []
+
         with self._mutex:
-            player = self._cache.get(username, None)
-            if isinstance(player, KnownPlayer):
-                self._cache[username] = update(player)
-            else:
-                logger.warning(f"Player {username} not found during update")
+            updated = False
+            for username in usernames:
+                player = self._cache.get(username, None)
+                if player is not None and player.kind is PlayerKind.KNOWN:
+                    self._cache[username] = update(player)
+                    updated = True
+                else:
+                    missing_usernames.append(username)
+
+            if updated:
+                self._epoch += 1
+
+        # Log outside the lock to not block the other threads on logging io
+        for username in missing_usernames:
+            logger.warning("Player %s not found during update", username)
 
     def uncache_player(self, username: str) -> None:
         """Clear the cache entry for `username`"""
         with self._mutex:
             self._cache.pop(username, None)
+            self._epoch += 1
+
+    def uncache_players(self, usernames: Iterable[str]) -> None:
+        """Clear the cache entries for all the `usernames`"""
+        with self._mutex:
+            for username in usernames:
+                self._cache.pop(username, None)
+            self._epoch += 1
 
     def clear_cache(self) -> None:
         """Clear the entire player cache"""
         with self._mutex:
             self._cache.clear()
+            self._epoch += 1
+
+    @property
+    def epoch(self) -> int:
+        """
+        Return a number that changes every time the contents of the cache change
+
+        Expiring entries also count as a change.
+        """
+        with self._mutex:
+            if self._cache.expire():
+                # Some entries expired
+                self._epoch += 1
+
+            return self._epoch
@@ -1,188 +1,289 @@
 import logging
+from collections.abc import Callable, Mapping
+from typing import Any, cast
 
 from examples.overlay.controller import OverlayController
-from examples.overlay.events import Event, EventType
+from examples.overlay.events import (
+    EndBedwarsGameEvent,
+    Event,
+    EventType,
+    InitializeAsEvent,
+    LobbyJoinEvent,
+    LobbyLeaveEvent,
+    LobbyListEvent,
+    LobbySwapEvent,
+    NewAPIKeyEvent,
+    NewNicknameEvent,
+    PartyAttachEvent,
+    PartyDetachEvent,
+    PartyJoinEvent,
+    PartyLeaveEvent,
+    PartyListIncomingEvent,
+    PartyMembershipListEvent,
+    StartBedwarsGameEvent,
+    WhisperCommandSetNickEvent,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def process_event(controller: OverlayController, event: Event) -> bool:
-    """Update the state based on the event, return True if a redraw is desired"""
-    from examples.overlay.behaviour import set_hypixel_api_key, set_nickname
-
+def process_initialize_as_event(
+    controller: OverlayController, event: InitializeAsEvent
+) -> bool:
+    # Initializing means the player restarted/switched accounts -> clear the state
     state = controller.state
+    state.own_username = event.username
+    state.clear_party()
+    state.clear_lobby()
 
-    if event.event_type is EventType.INITIALIZE_AS:
-        # Initializing means the player restarted/switched accounts -> clear the state
-        state.own_username = event.username
-        state.clear_party()
-        state.clear_lobby()
+    logger.info(f"Playing as {state.own_username}. Cleared party and lobby.")
+    return True
 
-        logger.info(f"Playing as {state.own_username}. Cleared party and lobby.")
-        return True
 
-    if event.event_type is EventType.NEW_NICKNAME:
-        # User got a new nickname
-        logger.info(f"Setting new nickname {event.nick}={state.own_username}")
-        if state.own_username is None:
-            logger.warning(
-                "Own username is not set, could not add denick entry for {event.nick}."
-            )
-            return False
-
-        set_nickname(
-            username=state.own_username, nick=event.nick, controller=controller
+def process_new_nickname_event(
+    controller: OverlayController, event: NewNicknameEvent
+) -> bool:
+    from examples.overlay.behaviour import set_nickname
+
+    # User got a new nickname
+    state = controller.state
+    logger.info(f"Setting new nickname {event.nick}={state.own_username}")
+    if state.own_username is None:
+        logger.warning(
+            "Own username is not set, could not add denick entry for {event.nick}."
         )
+        return False
 
-        # We should redraw so that we can properly denick ourself
-        return True
+    set_nickname(username=state.own_username, nick=event.nick, controller=controller)
 
-    if event.event_type is EventType.LOBBY_SWAP:
-        # Changed lobby -> clear the lobby
-        logger.info("Received lobby swap. Clearing the lobby")
-        state.clear_lobby()
-        state.leave_queue()
+    # We should redraw so that we can properly denick ourself
+    return True
 
-        return True
 
-    if event.event_type is EventType.LOBBY_LIST:
-        # Results from /who -> override lobby_players
-        logger.info(
-            f"Updating lobby players from who command: '{', '.join(event.usernames)}'"
-        )
+def process_lobby_swap_event(
+    controller: OverlayController, event: LobbySwapEvent
+) -> bool:
+    # Changed lobby -> clear the lobby
+    logger.info("Received lobby swap. Clearing the lobby")
+    controller.state.clear_lobby()
+    controller.state.leave_queue()
+
+    return True
+
+
+def process_lobby_list_event(
+    controller: OverlayController, event: LobbyListEvent
+) -> bool:
+    # Results from /who -> override lobby_players
+    logger.info(
+        f"Updating lobby players from who command: '{', '.join(event.usernames)}'"
+    )
+    state = controller.state
+    state.out_of_sync = False
+    state.join_queue()
+    state.set_lobby(event.usernames)
+
+    return True
+
+
+def process_lobby_join_event(
+    controller: OverlayController, event: LobbyJoinEvent
+) -> bool:
+    if event.player_cap < 8:
+        logger.debug("Gamemode has too few players to be bedwars. Skipping.")
+        return False
+
+    state = controller.state
+    state.join_queue()
+    state.add_to_lobby(event.username)
+
+    if event.player_count != len(state.lobby_players):
+        # We are out of sync with the lobby.
+        # This happens when you first join a lobby, as the previous lobby is
+        # never cleared. It could also be due to a bug.
+        logger.debug("Player count out of sync.")
+        out_of_sync = True
+
+        if event.player_count < len(state.lobby_players):
+            # We know of too many players, some must actually not be in the lobby
+            logger.debug("Too many players in lobby. Clearing.")
+            state.clear_lobby()
+            state.add_to_lobby(event.username)
+
+            # Clearing the lobby may have gotten us back in sync
+            out_of_sync = event.player_count != len(state.lobby_players)
+
+        state.out_of_sync = out_of_sync
+    else:
+        # We are in sync now
         state.out_of_sync = False
-        state.join_queue()
-        state.set_lobby(event.usernames)
 
-        return True
+    logger.info(
+        f"{event.username} joined your lobby "
+        f"({event.player_count}/{event.player_cap})"
+    )
 
-    if event.event_type is EventType.LOBBY_JOIN:
-        if event.player_cap < 8:
-            logger.debug("Gamemode has too few players to be bedwars. Skipping.")
-            return False
-
-        state.join_queue()
-        state.add_to_lobby(event.username)
-
-        if event.player_count != len(state.lobby_players):
-            # We are out of sync with the lobby.
-            # This happens when you first join a lobby, as the previous lobby is
-            # never cleared. It could also be due to a bug.
-            logger.debug("Player count out of sync.")
-            out_of_sync = True
-
-            if event.player_count < len(state.lobby_players):
-                # We know of too many players, some must actually not be in the lobby
-                logger.debug("Too many players in lobby. Clearing.")
-                state.clear_lobby()
-                state.add_to_lobby(event.username)
-
-                # Clearing the lobby may have gotten us back in sync
-                out_of_sync = event.player_count != len(state.lobby_players)
-
-            state.out_of_sync = out_of_sync
-        else:
-            # We are in sync now
-            state.out_of_sync = False
-
-        logger.info(
-            f"{event.username} joined your lobby "
-            f"({event.player_count}/{event.player_cap})"
-        )
+    return True
 
-        return True
 
-    if event.event_type is EventType.LOBBY_LEAVE:
-        # Someone left the lobby -> Remove them from the lobby
-        state.remove_from_lobby(event.username)
+def process_lobby_leave_event(
+    controller: OverlayController, event: LobbyLeaveEvent
+) -> bool:
+    # Someone left the lobby -> Remove them from the lobby
+    controller.state.remove_from_lobby(event.username)
 
-        logger.info(f"{event.username} left your lobby")
+    logger.info(f"{event.username} left your lobby")
 
-        return True
+    return True
 
-    if event.event_type is EventType.PARTY_DETACH:
-        # Leaving the party -> remove all but yourself from the party
-        logger.info("Leaving the party, clearing all members")
 
-        state.clear_party()
+def process_party_detach_event(
+    controller: OverlayController, event: PartyDetachEvent
+) -> bool:
+    # Leaving the party -> remove all but yourself from the party
+    logger.info("Leaving the party, clearing all members")
 
-        return True
+    controller.state.clear_party()
 
-    if event.event_type is EventType.PARTY_ATTACH:
-        # You joined a player's party -> add them to your party
-        state.clear_party()  # Make sure the party is clean to start with
-        state.add_to_party(event.username)
+    return True
 
-        logger.info(f"Joined {event.username}'s party")
 
-        return True
+def process_party_attach_event(
+    controller: OverlayController, event: PartyAttachEvent
+) -> bool:
+    # You joined a player's party -> add them to your party
+    controller.state.clear_party()  # Make sure the party is clean to start with
+    controller.state.add_to_party(event.username)
 
-    if event.event_type is EventType.PARTY_JOIN:
-        # Someone joined your party -> add them to your party
-        for username in event.usernames:
-            state.add_to_party(username)
+    logger.info(f"Joined {event.username}'s party")
 
-        logger.info(f"{' ,'.join(event.usernames)} joined your party")
+    return True
 
-        return True
 
-    if event.event_type is EventType.PARTY_LEAVE:
-        if state.own_username in event.usernames:
-            # You left the party -> clear the party instead
-            state.clear_party()
-            return True
+def process_party_join_event(
+    controller: OverlayController, event: PartyJoinEvent
+) -> bool:
+    # Someone joined your party -> add them to your party
+    for username in event.usernames:
+        controller.state.add_to_party(username)
+
+    logger.info(f"{' ,'.join(event.usernames)} joined your party")
 
-        # Someone left your party -> remove them from your party
-        for username in event.usernames:
-            state.remove_from_party(username)
+    return True
 
-        logger.info(f"{' ,'.join(event.usernames)} left your party")
 
+def process_party_leave_event(
+    controller: OverlayController, event: PartyLeaveEvent
+) -> bool:
+    state = controller.state
+    if state.own_username in event.usernames:
+        # You left the party -> clear the party instead
+        state.clear_party()
         return True
 
-    if event.event_type is EventType.PARTY_LIST_INCOMING:
-        # This is a response from /pl (/party list)
-        # In the following lines we will get all the party members -> clear the party
+    # Someone left your party -> remove them from your party
+    for username in event.usernames:
+        state.remove_from_party(username)
 
-        logger.debug(
-            "Receiving response from /pl -> clearing party and awaiting further data"
-        )
+    logger.info(f"{' ,'.join(event.usernames)} left your party")
 
-        state.clear_party()
+    return True
 
-        return False  # No need to redraw as we're waiting for further input
 
-    if event.event_type is EventType.PARTY_ROLE_LIST:
-        logger.info(f"Adding party {event.role} {', '.join(event.usernames)} from /pl")
+def process_party_list_incoming_event(
+    controller: OverlayController, event: PartyListIncomingEvent
+) -> bool:
+    # This is a response from /pl (/party list)
+    # In the following lines we will get all the party members -> clear the party
 
-        for username in event.usernames:
-            state.add_to_party(username)
+    logger.debug(
+        "Receiving response from /pl -> clearing party and awaiting further data"
+    )
 
-        return True
+    controller.state.clear_party()
 
-    if event.event_type is EventType.START_BEDWARS_GAME:
-        # Bedwars game has started
-        logger.info("Bedwars game starting")
-        state.leave_queue()
+    return False  # No need to redraw as we're waiting for further input
 
-        return False
 
-    if event.event_type is EventType.END_BEDWARS_GAME:
-        # Bedwars game has ended
-        logger.info("Bedwars game ended")
-        state.clear_lobby()
+def process_party_role_list_event(
+    controller: OverlayController, event: PartyMembershipListEvent
+) -> bool:
+    logger.info(f"Adding party {event.role} {', '.join(event.usernames)} from /pl")
 
-        return True
+    for username in event.usernames:
+        controller.state.add_to_party(username)
 
-    if event.event_type is EventType.NEW_API_KEY:
-        # User got a new API key
-        logger.info("Setting new API key")
-        set_hypixel_api_key(event.key, controller)
+    return True
 
-        return True
 
-    if event.event_type is EventType.WHISPER_COMMAND_SET_NICK:
-        # User set a nick with /w !nick=username
-        logger.info(f"Setting nick from whisper command {event.nick}={event.username}")
-        set_nickname(username=event.username, nick=event.nick, controller=controller)
-        return True
+def process_start_bedwars_game_event(
+    controller: OverlayController, event: StartBedwarsGameEvent
+) -> bool:
+    # Bedwars game has started
+    logger.info("Bedwars game starting")
+    controller.state.leave_queue()
+
+    return False
+
+
+def process_end_bedwars_game_event(
+    controller: OverlayController, event: EndBedwarsGameEvent
+) -> bool:
+    # Bedwars game has ended
+    logger.info("Bedwars game ended")
+    controller.state.clear_lobby()
+
+    return True
+
+
+def process_new_api_key_event(
+    controller: OverlayController, event: NewAPIKeyEvent
+) -> bool:
+    from examples.overlay.behaviour import set_hypixel_api_key
+
+    # User got a new API key
+    logger.info("Setting new API key")
+    set_hypixel_api_key(event.key, controller)
+
+    return True
+
+
+def process_whisper_command_set_nick_event(
+    controller: OverlayController, event: WhisperCommandSetNickEvent
+) -> bool:
+    from examples.overlay.behaviour import set_nickname
+
+    # User set a nick with /w !nick=username
+    logger.info(f"Setting nick from whisper command {event.nick}={event.username}")
+    set_nickname(username=event.username, nick=event.nick, controller=controller)
+    return True
+
+
+# Handler for each event type. The handler receives the event of the matching type
+EVENT_HANDLERS: Mapping[EventType, Callable[[OverlayController, Any], bool]] = {
+    EventType.INITIALIZE_AS: process_initialize_as_event,
+    EventType.NEW_NICKNAME: process_new_nickname_event,
+    EventType.LOBBY_SWAP: process_lobby_swap_event,
+    EventType.LOBBY_JOIN: process_lobby_join_event,
+    EventType.LOBBY_LEAVE: process_lobby_leave_event,
+    EventType.LOBBY_LIST: process_lobby_list_event,
+    EventType.PARTY_ATTACH: process_party_attach_event,
+    EventType.PARTY_DETACH: process_party_detach_event,
+    EventType.PARTY_JOIN: process_party_join_event,
+    EventType.PARTY_LEAVE: process_party_leave_event,
+    EventType.PARTY_LIST_INCOMING: process_party_list_incoming_event,
+    EventType.PARTY_ROLE_LIST: process_party_role_list_event,
+    EventType.START_BEDWARS_GAME: process_start_bedwars_game_event,
+    EventType.END_BEDWARS_GAME: process_end_bedwars_game_event,
+    EventType.NEW_API_KEY: process_new_api_key_event,
+    EventType.WHISPER_COMMAND_SET_NICK: process_whisper_command_set_nick_event,
+}
+
+
+def process_event(controller: OverlayController, event: Event) -> bool:
+    """Update the state based on the event, return True if a redraw is desired"""
+    # The handler for an event type only accepts events of that type
+    handler = cast(
+        Callable[[OverlayController, Event], bool], EVENT_HANDLERS[event.event_type]
+    )
+    return handler(controller, event)
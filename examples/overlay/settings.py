@@ -1,4 +1,5 @@
 import logging
+import sys
 import threading
 from collections.abc import Callable, MutableMapping
 from dataclasses import dataclass, field
@@ -7,6 +8,12 @@ from typing import Type, TypedDict, TypeVar
 
 import toml
 
+if sys.version_info >= (3, 11):
+    # Use the faster C parser from the standard library when available
+    from tomllib import loads as parse_toml
+else:  # pragma: nocover
+    from toml import loads as parse_toml
+
 PLACEHOLDER_API_KEY = "insert-your-key-here"
 
 
@@ -30,6 +37,14 @@ class SettingsDict(TypedDict):
     known_nicks: dict[str, NickValue]
 
 
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """The serialized settings at some point in time"""
+
+    generation: int
+    serialized: str
+
+
 # Generic type to allow subclassing Settings
 DerivedSettings = TypeVar("DerivedSettings", bound="Settings")
 
@@ -47,6 +62,18 @@ class Settings:
     mutex: threading.Lock = field(
         default_factory=threading.Lock, init=False, compare=False, repr=False
     )
+    # Index of known_nicks mapping uuid -> nick
+    uuid_to_nick: dict[str, str] = field(init=False, compare=False, repr=False)
+    # Serializes writes to disk and orders them by the generation of the snapshot
+    write_mutex: threading.Lock = field(
+        default_factory=threading.Lock, init=False, compare=False, repr=False
+    )
+    generation: int = field(default=0, init=False, compare=False, repr=False)
+    flushed_generation: int = field(default=0, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Set the .uuid_to_nick field"""
+        self.index_known_nicks()
 
     @classmethod
     def from_dict(
@@ -62,6 +89,7 @@ class Settings:
         )
 
     def to_dict(self) -> SettingsDict:
+        """Return the settings as a dict, sharing known_nicks (no copy is made)"""
         return {
             "show_on_tab": self.show_on_tab,
             "hypixel_api_key": self.hypixel_api_key,
@@ -77,10 +105,76 @@ class Settings:
         self.antisniper_api_key = new_settings["antisniper_api_key"]
         self.use_antisniper_api = new_settings["use_antisniper_api"]
         self.known_nicks = new_settings["known_nicks"]
-
-    def flush_to_disk(self) -> None:
-        with self.path.open("w") as f:
-            toml.dump(self.to_dict(), f)
+        self.index_known_nicks()
+
+    def index_known_nicks(self) -> None:
+        """
+        Rebuild the uuid -> nick index from known_nicks
+
+        The index holds the first nick in known_nicks for each uuid.
+        """
+        self.uuid_to_nick = {}
+        for nick, nick_value in self.known_nicks.items():
+            self.uuid_to_nick.setdefault(nick_value["uuid"], nick)
+
+    def set_known_nick(self, nick: str, nick_value: NickValue) -> None:
+        """Add or replace the entry for `nick` in known_nicks"""
+        self.remove_known_nick(nick)
+        # The new entry is last in known_nicks, so it only takes over empty slots
+        self.known_nicks[nick] = nick_value
+        self.uuid_to_nick.setdefault(nick_value["uuid"], nick)
+
+    def remove_known_nick(self, nick: str) -> None:
+        """Remove the entry for `nick` from known_nicks if present"""
+        nick_value = self.known_nicks.pop(nick, None)
+        if nick_value is None:
+            return
+
+        uuid = nick_value["uuid"]
+        if self.uuid_to_nick.get(uuid, None) != nick:
+            return
+
+        # Fall back to the next nick for this uuid, if any
+        del self.uuid_to_nick[uuid]
+        for other_nick, other_nick_value in self.known_nicks.items():
+            if other_nick_value["uuid"] == uuid:
+                self.uuid_to_nick[uuid] = other_nick
+                break
+
+    def serialize(self) -> str:
+        """Serialize the settings to the format stored on disk"""
+        return toml.dumps(self.to_dict())
+
+    def snapshot(self) -> SettingsSnapshot:
+        """
+        Serialize the settings for a later call to .flush_to_disk()
+
+        Must be called while holding .mutex so that the generations of the
+        snapshots match the order of the changes to the settings.
+        """
+        self.generation += 1
+        return SettingsSnapshot(generation=self.generation, serialized=self.serialize())
+
+    def flush_to_disk(self, snapshot: SettingsSnapshot | None = None) -> None:
+        """
+        Write the settings to disk
+
+        Pass the output of .snapshot() to write a snapshot taken earlier. This
+        allows writing to disk without holding the lock on the settings.
+        Snapshots older than the last one written are dropped.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        with self.write_mutex:
+            if snapshot.generation <= self.flushed_generation:
+                # A newer snapshot has already been written to disk
+                return
+
+            with self.path.open("w") as f:
+                f.write(snapshot.serialized)
+
+            self.flushed_generation = snapshot.generation
 
 
 # Generic type for value_or_default
@@ -98,7 +192,8 @@ def api_key_is_valid(key: str) -> bool:
 
 
 def read_settings(path: Path) -> MutableMapping[str, object]:
-    return toml.load(path)
+    with path.open("r", encoding="utf-8") as f:
+        return parse_toml(f.read())
 
 
 def fill_missing_settings(
@@ -17,15 +17,21 @@ logger = logging.getLogger(__name__)
 class UpdateStateThread(threading.Thread):  # pragma: nocover
     """Thread that reads from the logfile and updates the state"""
 
-    def __init__(self, controller: OverlayController, loglines: Iterable[str]) -> None:
+    def __init__(
+        self,
+        controller: OverlayController,
+        loglines: Iterable[str],
+        at_eof: Callable[[], bool] | None = None,
+    ) -> None:
         super().__init__(daemon=True)  # Don't block the process from exiting
         self.controller = controller
         self.loglines = loglines
+        self.at_eof = at_eof
 
     def run(self) -> None:
         """Read self.loglines and update self.controller"""
         try:
-            process_loglines(self.loglines, self.controller)
+            process_loglines(self.loglines, self.controller, at_eof=self.at_eof)
         except Exception as e:
             logger.exception(f"Exception caught in state update thread: {e}. Exiting")
             return
@@ -37,7 +43,7 @@ class GetStatsThread(threading.Thread):  # pragma: nocover
     def __init__(
         self,
         requests_queue: queue.Queue[str],
-        completed_queue: queue.Queue[str],
+        completed_queue: queue.SimpleQueue[str],
         controller: OverlayController,
     ) -> None:
         super().__init__(daemon=True)  # Don't block the process from exiting
@@ -64,7 +70,10 @@ class GetStatsThread(threading.Thread):  # pragma: nocover
 
 
 def prepare_overlay(
-    controller: OverlayController, loglines: Iterable[str], thread_count: int
+    controller: OverlayController,
+    loglines: Iterable[str],
+    thread_count: int,
+    at_eof: Callable[[], bool] | None = None,
 ) -> Callable[[], list[Player] | None]:  # pragma: nocover
     """
     Set up and return get_stat_list
@@ -78,10 +87,10 @@ def prepare_overlay(
     # Usernames we want the stats of
     requested_stats_queue = queue.Queue[str]()
     # Usernames we have newly downloaded the stats of
-    completed_stats_queue = queue.Queue[str]()
+    completed_stats_queue = queue.SimpleQueue[str]()
 
     # Spawn thread for updating state
-    UpdateStateThread(controller=controller, loglines=loglines).start()
+    UpdateStateThread(controller=controller, loglines=loglines, at_eof=at_eof).start()
 
     # Spawn threads for downloading stats
     for i in range(thread_count):
@@ -91,23 +100,37 @@ def prepare_overlay(
             controller=controller,
         ).start()
 
+    # The inputs and output of the last computed stat list
+    last_stat_list: list[Player] = []
+    last_stat_list_key: tuple[int, set[str], set[str]] | None = None
+
     def get_stat_list() -> list[Player] | None:
         """
         Get an updated list of stats of the players in the lobby. None if no updates
         """
+        nonlocal last_stat_list, last_stat_list_key
 
         redraw = should_redraw(controller, completed_stats_queue=completed_stats_queue)
 
         if not redraw:
             return None
 
-        # Get the cached stats for the players in the lobby
-        players: list[Player] = []
+        # NOTE: Read the epoch before reading from the cache so that any concurrent
+        #       changes invalidate the computed list
+        cache_epoch = controller.player_cache.epoch
 
         with controller.state.mutex:
             lobby_players = controller.state.lobby_players.copy()
             party_members = controller.state.party_members.copy()
 
+        stat_list_key = (cache_epoch, lobby_players, party_members)
+        if stat_list_key == last_stat_list_key:
+            # Neither the cache nor the lobby changed since the last computation
+            return last_stat_list.copy()
+
+        # Get the cached stats for the players in the lobby
+        players: list[Player] = []
+
         for player in lobby_players:
             cached_stats = controller.player_cache.get_cached_player(player)
             if cached_stats is None:
@@ -120,6 +143,8 @@ def prepare_overlay(
 
         sorted_stats = sort_players(players, party_members)
 
+        last_stat_list, last_stat_list_key = sorted_stats.copy(), stat_list_key
+
         return sorted_stats
 
     return get_stat_list
@@ -15,7 +15,7 @@ import toml
 
 from examples.overlay.events import NewAPIKeyEvent
 from examples.overlay.file_utils import watch_file_with_reopen
-from examples.overlay.parsing import parse_logline
+from examples.overlay.parsing import NEW_API_KEY_PREFIX, parse_logline
 from examples.overlay.settings import api_key_is_valid, read_settings
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,10 @@ def search_logfile_for_key(
                 return found_key
             continue
 
+        if NEW_API_KEY_PREFIX not in line:
+            # Cheap substring check to skip fully parsing irrelevant lines
+            continue
+
         event = parse_logline(line)
 
         if isinstance(event, NewAPIKeyEvent):
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 
+import functools
 import math
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from prism.calc import bedwars_level_from_exp
-from prism.minecraft import MojangAPIError, get_uuid
+from prism.minecraft import MojangAPIError, get_uuid, get_uuids
 from prism.playerdata import (
     HypixelAPIError,
     HypixelAPIKeyError,
@@ -24,6 +26,11 @@ try:
 except ImportError:
     NICK_DATABASE: dict[str, str] = {}  # type: ignore[no-redef]
 
+# Case insensitive index into NICK_DATABASE. The first nick wins on collisions
+LOWERCASE_NICK_DATABASE = {
+    nick.lower(): uuid for nick, uuid in reversed(NICK_DATABASE.items())
+}
+
 
 api_key = read_key(Path(sys.path[0]) / "api_key")
 key_holder = HypixelAPIKeyHolder(api_key)
@@ -63,9 +70,12 @@ assert set(mode_prefixes.keys()) == set(mode_names.keys()) == set(mode_order)
 assert set(stat_names.keys()) == set(stat_order)
 
 
-def get_sep(column: str) -> str:
-    """Get the separator used in prints for this column"""
-    return "\n" if column == COLUMN_ORDER[-1] else SEP
+# Header of the stats table, and how to justify the cells in each column
+TABLE_HEADER = tuple(stat_names.get(column, "") for column in COLUMN_ORDER)
+# Left justify the row label, right justify the cells
+ROW_JUSTIFY = tuple(
+    str.ljust if column == "mode_name" else str.rjust for column in COLUMN_ORDER
+)
 
 
 def div_string(dividend: float, divisor: float, decimals: int = 2) -> str:
@@ -78,7 +88,25 @@ def div_string(dividend: float, divisor: float, decimals: int = 2) -> str:
     if isinstance(quotient, int):
         return str(quotient)
 
-    return truncate_float(quotient, 2)
+    return truncate_float(quotient, decimals)
+
+
+def get_table_row(bw_stats: dict[str, Any], mode: str) -> tuple[str, ...]:
+    """Return the formatted stats in the given mode in COLUMN_ORDER"""
+    prefix = mode_prefixes[mode]
+    final_kills = bw_stats.get(f"{prefix}final_kills_bedwars", 0)
+    final_deaths = bw_stats.get(f"{prefix}final_deaths_bedwars", 0)
+    wins = bw_stats.get(f"{prefix}wins_bedwars", 0)
+    games_played = bw_stats.get(f"{prefix}games_played_bedwars", 0)
+
+    return (
+        mode_names[mode],
+        str(final_kills),
+        div_string(final_kills, final_deaths),
+        str(wins),
+        div_string(wins, games_played - wins),
+        str(bw_stats.get(f"{prefix}winstreak", "-")),
+    )
 
 
 def print_bedwars_stats(playerdata: dict[str, Any], nick: str | None = None) -> None:
@@ -107,7 +135,7 @@ def print_bedwars_stats(playerdata: dict[str, Any], nick: str | None = None) ->
     else:
         online = last_login > last_logout
 
-        now = datetime.now().timestamp()
+        now = time.time()
         time_since_login = now - last_login
         time_since_logout = now - last_logout
 
@@ -116,90 +144,109 @@ def print_bedwars_stats(playerdata: dict[str, Any], nick: str | None = None) ->
             f"{format_seconds(time_since_login if online else time_since_logout)}"
         )
 
-    table = {
-        mode: {
-            "fks": str(bw_stats.get(f"{prefix}final_kills_bedwars", 0)),
-            "fkdr": div_string(
-                bw_stats.get(f"{prefix}final_kills_bedwars", 0),
-                bw_stats.get(f"{prefix}final_deaths_bedwars", 0),
-            ),
-            "wins": str(bw_stats.get(f"{prefix}wins_bedwars", 0)),
-            "wlr": div_string(
-                bw_stats.get(f"{prefix}wins_bedwars", 0),
-                bw_stats.get(f"{prefix}games_played_bedwars", 0)
-                - bw_stats.get(f"{prefix}wins_bedwars", 0),
-            ),
-            "winstreak": str(bw_stats.get(f"{prefix}winstreak", "-")),
-            "mode_name": mode_names[mode],
-        }
-        for mode, prefix in mode_prefixes.items()
-    }
-
-    column_widths = {
-        column: len(
-            max(
-                [
-                    stat_names.get(column, ""),
-                    *(table[mode][column] for mode in table.keys()),
-                ],
-                key=len,
-            )
-        )
-        for column in COLUMN_ORDER
-    }
+    rows = [get_table_row(bw_stats, mode) for mode in mode_order]
+
+    column_widths = [
+        max(map(len, column)) for column in zip(TABLE_HEADER, *rows, strict=True)
+    ]
 
     # Table header
-    for column in COLUMN_ORDER:
+    print(
+        SEP.join(cell.ljust(width) for cell, width in zip(TABLE_HEADER, column_widths))
+    )
+
+    for row in rows:
         print(
-            stat_names.get(column, "").ljust(column_widths[column]), end=get_sep(column)
+            SEP.join(
+                justify(cell, width)
+                for cell, justify, width in zip(row, ROW_JUSTIFY, column_widths)
+            )
         )
 
-    for mode in mode_order:
-        for column in COLUMN_ORDER:
-            # Left justify the row label, right justify the cells
-            justify = str.ljust if column == "mode_name" else str.rjust
 
-            print(
-                justify(table[mode].get(column, ""), column_widths[column]),
-                end=get_sep(column),
-            )
+# Either the playerdata and the nick of the player, or an error message
+FetchResult = tuple[dict[str, Any], str | None] | str
 
+# Max amount of players to fetch at the same time. Bounded by the rate limiter anyway
+MAX_FETCH_WORKERS = 16
 
-def get_and_display(username: str) -> None:
-    try:
-        uuid = get_uuid(username)
-        nick = None
-    except MojangAPIError:
-        failed_getting_uuid = True
-        uuid = None
-    else:
+
+def fetch_player(
+    username: str, known_uuids: dict[str, str] | None = None
+) -> FetchResult:
+    """
+    Get the playerdata of the given user
+
+    known_uuids is the result of a bulk lookup with get_uuids including username
+    """
+    nick = None
+    if known_uuids is not None:
+        uuid = known_uuids.get(username.lower(), None)
         failed_getting_uuid = False
+    else:
+        try:
+            uuid = get_uuid(username)
+        except MojangAPIError:
+            failed_getting_uuid = True
+            uuid = None
+        else:
+            failed_getting_uuid = False
 
     # The player may be nicked. Look up in nick database
     if uuid is None or failed_getting_uuid:
-        matching_nicks = list(
-            filter(lambda nick: nick.lower() == username.lower(), NICK_DATABASE.keys())
-        )
+        uuid = LOWERCASE_NICK_DATABASE.get(username.lower(), None)
 
-        if matching_nicks:
-            uuid = NICK_DATABASE[matching_nicks[0]]
+        if uuid is not None:
             nick = username
 
     if uuid is None:
-        print(f"Could not find user with username {username}")
-        return
+        return f"Could not find user with username {username}"
 
     try:
         playerdata = get_player_data(uuid, key_holder)
     except (HypixelAPIError, HypixelAPIKeyError) as e:
-        print(e)
-    else:
-        print_bedwars_stats(playerdata, nick=nick)
+        return str(e)
+
+    return playerdata, nick
+
+
+def display_player(result: FetchResult) -> None:
+    """Print the stats table or the error message from fetch_player"""
+    if isinstance(result, str):
+        print(result)
+        return
+
+    playerdata, nick = result
+    print_bedwars_stats(playerdata, nick=nick)
+
+
+def get_and_display(username: str, known_uuids: dict[str, str] | None = None) -> None:
+    """
+    Print the stats of the given user
+
+    known_uuids is the result of a bulk lookup with get_uuids including username
+    """
+    display_player(fetch_player(username, known_uuids))
 
 
 def main() -> None:
-    for i, username in enumerate(sys.argv[1:]):
-        get_and_display(username)
+    usernames = sys.argv[1:]
+
+    # Look up all the uuids in as few requests as possible
+    known_uuids: dict[str, str] | None
+    try:
+        known_uuids = get_uuids(usernames)
+    except MojangAPIError:
+        known_uuids = None  # Fall back to looking up each username
+
+    # Fetch the stats in parallel, and print them in order as they come in
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(usernames), MAX_FETCH_WORKERS))
+    ) as executor:
+        for result in executor.map(
+            functools.partial(fetch_player, known_uuids=known_uuids), usernames
+        ):
+            display_player(result)
 
     while True:
         try:
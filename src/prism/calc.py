@@ -1,6 +1,8 @@
 """
 Module from calculating bedwars star from exp
 """
+import functools
+
 # Amount of levels to prestige
 LEVELS_PER_PRESTIGE = 100
 
@@ -20,6 +22,7 @@ EASY_LEVELS = len(EASY_LEVEL_COSTS)
 PRESTIGE_EXP = EASY_EXP + (100 - EASY_LEVELS) * LEVEL_COST
 
 
+@functools.lru_cache(maxsize=4096)
 def bedwars_level_from_exp(exp: int) -> float:
     """
     Return the bedwars level corresponding to the given experience
@@ -1,12 +1,20 @@
+import sqlite3
 import threading
+import time
+from collections.abc import Callable, Iterable
 from json import JSONDecodeError
+from pathlib import Path
+from typing import Any
 
 import requests
 from requests.exceptions import RequestException
 
 from prism.ratelimiting import RateLimiter
+from prism.utils import REQUEST_TIMEOUT, make_session, send_ratelimited
 
 USERPROFILES_ENDPOINT = "https://api.mojang.com/users/profiles/minecraft"
+BULK_PROFILES_ENDPOINT = "https://api.mojang.com/profiles/minecraft"
+BULK_PROFILES_LIMIT = 10  # Max usernames per request to the bulk endpoint
 REQUEST_LIMIT, REQUEST_WINDOW = 100, 60  # Max requests per time window
 
 
@@ -19,25 +27,126 @@ class MojangAPIError(ValueError):
 # Be nice to the Mojang api :)
 limiter = RateLimiter(limit=REQUEST_LIMIT, window=REQUEST_WINDOW)
 
-# TODO: implement a disk cache
+# Reuse connections to the Mojang api
+session = make_session()
+
 # TTL on this cache can be large because for a username to get a new uuid the user
 # must first change their ign, then, after 37 days, someone else can get the name
 LOWERCASE_UUID_CACHE: dict[str, str] = {}  # Mapping username.lower() -> uuid
 UUID_MUTEX = threading.Lock()
 
+DISK_UUID_CACHE_TTL = 60 * 60 * 24 * 7  # One week, well within the 37 days
+
+
+class DiskUUIDCache:
+    """
+    Cache mapping username.lower() -> uuid persisted in an sqlite database
+
+    Entries older than `ttl` seconds are treated as missing.
+    Not thread-safe on its own. get_uuid guards it with UUID_MUTEX.
+    """
+
+    def __init__(self, path: Path, ttl: float = DISK_UUID_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self.connection:
+            # Write-ahead logging with relaxed syncing for cheap writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS uuid_cache (username TEXT PRIMARY KEY, "
+                "uuid TEXT NOT NULL, timestamp REAL NOT NULL)"
+            )
+
+    def get(self, username: str) -> str | None:
+        """Return the cached uuid for the username, None if missing or stale"""
+        row = self.connection.execute(
+            "SELECT uuid, timestamp FROM uuid_cache WHERE username = ?",
+            (username.lower(),),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        uuid, timestamp = row
+
+        if time.time() - timestamp > self.ttl:
+            return None
+
+        assert isinstance(uuid, str)
+        return uuid
+
+    def set(self, username: str, uuid: str) -> None:
+        """Store the uuid for the username"""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO uuid_cache VALUES (?, ?, ?)",
+                (username.lower(), uuid, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the connection to the database"""
+        self.connection.close()
+
+
+# Optional persistent backing for LOWERCASE_UUID_CACHE. Enable with set_disk_uuid_cache
+DISK_UUID_CACHE: DiskUUIDCache | None = None
+
+
+def set_disk_uuid_cache(disk_uuid_cache: DiskUUIDCache | None) -> None:
+    """Set the disk cache used to persist uuids between sessions"""
+    global DISK_UUID_CACHE
 
-def get_uuid(username: str) -> str | None:  # pragma: nocover
-    """Get the uuid of all the user. None if not found."""
     with UUID_MUTEX:
-        cache_hit = LOWERCASE_UUID_CACHE.get(username.lower(), None)
+        DISK_UUID_CACHE = disk_uuid_cache
 
-    if cache_hit is not None:
-        return cache_hit
 
+def _get_cached_uuid(username: str) -> str | None:
+    """
+    Look up the username in the memory cache, then in the disk cache
+
+    Caller must hold UUID_MUTEX
+    """
+    cache_hit = LOWERCASE_UUID_CACHE.get(username.lower(), None)
+
+    if cache_hit is None and DISK_UUID_CACHE is not None:
+        try:
+            cache_hit = DISK_UUID_CACHE.get(username)
+        except sqlite3.Error:
+            pass  # The disk cache is best effort - fall back to the api
+        else:
+            if cache_hit is not None:
+                LOWERCASE_UUID_CACHE[username.lower()] = cache_hit
+
+    return cache_hit
+
+
+def _set_cached_uuid(username: str, uuid: str) -> None:
+    """
+    Store the uuid in the memory cache and the disk cache
+
+    Caller must hold UUID_MUTEX
+    """
+    LOWERCASE_UUID_CACHE[username.lower()] = uuid
+
+    if DISK_UUID_CACHE is not None:
+        try:
+            DISK_UUID_CACHE.set(username, uuid)
+        except sqlite3.Error:
+            pass  # The disk cache is best effort
+
+
+def _request_mojang_json(send: Callable[[], requests.Response]) -> Any:
+    """
+    Send a request to the Mojang api and return the parsed json response
+
+    Returns None if the request succeeded without a 200 response (no content).
+    Raises MojangAPIError on connection errors, error responses and invalid json.
+    """
     try:
         # Uphold our prescribed rate-limits
-        with limiter:
-            response = requests.get(f"{USERPROFILES_ENDPOINT}/{username}")
+        response = send_ratelimited(limiter, send)
     except RequestException as e:
         raise MojangAPIError(
             f"Request to Mojang API failed due to a connection error {e}"
@@ -53,13 +162,31 @@ def get_uuid(username: str) -> str | None:  # pragma: nocover
         return None
 
     try:
-        response_json = response.json()
+        return response.json()
     except JSONDecodeError:
         raise MojangAPIError(
             "Failed parsing the response from the Mojang API. "
             f"Raw content: {response.text}"
         )
 
+
+def get_uuid(username: str) -> str | None:  # pragma: nocover
+    """Get the uuid of all the user. None if not found."""
+    with UUID_MUTEX:
+        cache_hit = _get_cached_uuid(username)
+
+    if cache_hit is not None:
+        return cache_hit
+
+    response_json = _request_mojang_json(
+        lambda: session.get(
+            f"{USERPROFILES_ENDPOINT}/{username}", timeout=REQUEST_TIMEOUT
+        )
+    )
+
+    if response_json is None:
+        return None
+
     # reponse is {"id": "...", "name": "..."}
     uuid = response_json["id"]
 
@@ -70,6 +197,62 @@ def get_uuid(username: str) -> str | None:  # pragma: nocover
 
     # Set cache
     with UUID_MUTEX:
-        LOWERCASE_UUID_CACHE[username.lower()] = uuid
+        _set_cached_uuid(username, uuid)
 
     return uuid
+
+
+def get_uuids(usernames: Iterable[str]) -> dict[str, str]:
+    """
+    Get the uuids of the users in bulk. Mapping username.lower() -> uuid
+
+    Users that were not found are missing from the result.
+    Makes one request per BULK_PROFILES_LIMIT usernames not found in the cache.
+    """
+    uuids: dict[str, str] = {}
+    uncached_usernames: list[str] = []
+
+    with UUID_MUTEX:
+        for username in dict.fromkeys(username.lower() for username in usernames):
+            cache_hit = _get_cached_uuid(username)
+            if cache_hit is not None:
+                uuids[username] = cache_hit
+            else:
+                uncached_usernames.append(username)
+
+    for i in range(0, len(uncached_usernames), BULK_PROFILES_LIMIT):
+        batch = uncached_usernames[i : i + BULK_PROFILES_LIMIT]
+
+        response_json = _request_mojang_json(
+            lambda: session.post(
+                BULK_PROFILES_ENDPOINT, json=batch, timeout=REQUEST_TIMEOUT
+            )
+        )
+
+        # reponse is [{"id": "...", "name": "..."}, ...] with the found users
+        if not isinstance(response_json, list):
+            raise MojangAPIError(
+                f"Request to Mojang API returned wrong type {response_json=}"
+            )
+
+        for profile in response_json:
+            if not isinstance(profile, dict):
+                raise MojangAPIError(
+                    f"Request to Mojang API returned wrong type for profile {profile=}"
+                )
+
+            uuid, name = profile.get("id", None), profile.get("name", None)
+            if not isinstance(uuid, str) or not isinstance(name, str):
+                raise MojangAPIError(
+                    f"Request to Mojang API returned wrong type for profile {profile=}"
+                )
+
+            uuids[name.lower()] = uuid
+
+        # Set cache
+        with UUID_MUTEX:
+            for username in batch:
+                if username in uuids:
+                    _set_cached_uuid(username, uuids[username])
+
+    return uuids
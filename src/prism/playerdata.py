@@ -1,10 +1,10 @@
-from json import JSONDecodeError
 from typing import Any
 
-import requests
+import orjson
 from requests.exceptions import RequestException
 
 from prism.ratelimiting import RateLimiter
+from prism.utils import REQUEST_TIMEOUT, make_session, send_ratelimited
 
 PLAYER_ENDPOINT = "https://api.hypixel.net/player"
 REQUEST_LIMIT, REQUEST_WINDOW = 100, 60  # Max requests per time window
@@ -19,6 +19,8 @@ class HypixelAPIKeyHolder:
         self.key = key
         # Be nice to the Hypixel api :)
         self.limiter = RateLimiter(limit=limit, window=window)
+        # Reuse connections to the api
+        self.session = make_session()
 
 
 class MissingStatsError(ValueError):
@@ -45,10 +47,14 @@ def get_player_data(
     """Get data about the given player from the /player API endpoint"""
     try:
         # Uphold our prescribed rate-limits
-        with key_holder.limiter:
-            response = requests.get(
-                f"{PLAYER_ENDPOINT}?key={key_holder.key}&uuid={uuid}"
-            )
+        response = send_ratelimited(
+            key_holder.limiter,
+            lambda: key_holder.session.get(
+                PLAYER_ENDPOINT,
+                params={"key": key_holder.key, "uuid": uuid},
+                timeout=REQUEST_TIMEOUT,
+            ),
+        )
     except RequestException as e:
         raise HypixelAPIError(
             f"Request to Hypixel API failed due to a connection error {e}"
@@ -67,8 +73,8 @@ def get_player_data(
         )
 
     try:
-        response_json = response.json()
-    except JSONDecodeError:
+        response_json = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         raise HypixelAPIError(
             "Failed parsing the response from the Hypixel API. "
             f"Raw content: {response.text}"
@@ -1,7 +1,22 @@
+import time
 from collections import deque
+from collections.abc import Callable
 from enum import Enum, unique
 from pathlib import Path
-from typing import Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from prism.ratelimiting import RateLimiter
+
+REQUEST_TIMEOUT = 10  # Seconds to wait for a response from an api
+
+# Transient server errors that are worth retrying
+RETRY_STATUS_CODES = frozenset((500, 502, 503, 504))
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2  # Seconds to wait before the first retry. Doubles every retry
 
 
 class SupportsLT(Protocol):  # pragma: no cover
@@ -9,6 +24,52 @@ class SupportsLT(Protocol):  # pragma: no cover
         ...
 
 
+def make_session(pool_maxsize: int = 16) -> requests.Session:
+    """
+    Create a session that keeps connections to the api alive between requests
+
+    Up to `pool_maxsize` connections are kept, so that many threads can reuse them.
+    The session does not retry requests, as every attempt should go through a
+    RateLimiter. See send_ratelimited.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize),
+    )
+    return session
+
+
+def send_ratelimited(
+    limiter: "RateLimiter",
+    send: Callable[[], requests.Response],
+    *,
+    retries: int = MAX_RETRIES,
+    backoff: float = RETRY_BACKOFF,
+) -> requests.Response:
+    """
+    Send a request within the rate limit, retrying transient errors
+
+    Each attempt acquires its own slot in the limiter.
+    Retries connection errors and RETRY_STATUS_CODES up to `retries` times, then
+    raises the connection error or returns the last response.
+    """
+    attempt = 0
+    while True:
+        try:
+            with limiter:
+                response = send()
+        except requests.ConnectionError:
+            if attempt >= retries:
+                raise
+        else:
+            if attempt >= retries or response.status_code not in RETRY_STATUS_CODES:
+                return response
+
+        time.sleep(backoff * 2**attempt)
+        attempt += 1
+
+
 def read_key(key_file: Path) -> str:
     """Read the api key from the given file"""
     with key_file.open("r") as f:
@@ -20,8 +81,8 @@ def truncate_float(number: float, precision: int, *, extra_digits: int = 10) ->
     if precision <= 0:
         raise ValueError("Negative precision not supported")
 
-    # The result of the f-string is "{:.10f}" if precision + extra_digits == 10
-    return f"{{:.{precision + extra_digits}f}}".format(number)[:-extra_digits]
+    # Format with extra digits in a single pass, then cut them off to round down
+    return ("%.*f" % (precision + extra_digits, number))[:-extra_digits]
 
 
 def pluralize(word: str) -> str:
@@ -49,7 +110,11 @@ def insort_right(elements: deque[Element], new_element: Element) -> None:
     If new_element is already in elements it will be inserted to the right
     NOTE: Assumes new_element is relatively large in elements
     """
-    i = -1  # Init in case deque is empty
+    if not elements or not new_element < elements[-1]:
+        # Fast path: new_element is the largest so far, as is usually the case
+        elements.append(new_element)
+        return
+
     # We assume new_element is large, so we do a linear search from the end
     for i, old_element in enumerate(reversed(elements)):
         # not < is equivalent to >=
@@ -1,8 +1,11 @@
+import unittest.mock
+
 import pytest
 
 from examples.overlay.output.overlay.utils import (
     DEFAULT_COLOR,
     LEVEL_COLORMAP,
+    Cell,
     CellValue,
     OverlayRowData,
     player_to_row,
@@ -186,3 +189,31 @@ assert len(test_ids) == len(set(test_ids)), "Test ids should be unique"
 def test_stats_to_row(player: Player, row: OverlayRowData[PropertyName]) -> None:
     """Assert that player_to_row functions properly"""
     assert player_to_row(player) == row
+
+
+def test_cell_set_value() -> None:
+    """Assert that Cell.set_value only writes changed values"""
+    label = unittest.mock.MagicMock()
+    variable = unittest.mock.MagicMock()
+    cell = Cell(label=label, variable=variable)
+
+    cell.set_value(CellValue("1.00", rating0))
+    variable.set.assert_called_once_with("1.00")
+    label.configure.assert_called_once_with(fg=rating0)
+
+    # Nothing changed
+    cell.set_value(CellValue("1.00", rating0))
+    assert variable.set.call_count == 1
+    assert label.configure.call_count == 1
+
+    # Only the color changed
+    cell.set_value(CellValue("1.00", rating1))
+    assert variable.set.call_count == 1
+    label.configure.assert_called_with(fg=rating1)
+    assert label.configure.call_count == 2
+
+    # Only the text changed
+    cell.set_value(CellValue("2.00", rating1))
+    variable.set.assert_called_with("2.00")
+    assert variable.set.call_count == 2
+    assert label.configure.call_count == 2
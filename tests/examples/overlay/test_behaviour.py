@@ -34,7 +34,7 @@ UUID = "MyUUID"
 def set_known_nicks(known_nicks: dict[str, str], controller: OverlayController) -> None:
     """Update the settings and nickdatabase with the uuid->nick mapping"""
     for uuid, nick in known_nicks.items():
-        controller.settings.known_nicks[nick] = {"uuid": uuid, "comment": ""}
+        controller.settings.set_known_nick(nick, {"uuid": uuid, "comment": ""})
         controller.nick_database.default_database[nick] = uuid
 
 
@@ -293,12 +293,15 @@ def test_should_redraw(
     if redraw_event_set:
         controller.redraw_event.set()
 
-    completed_stats_queue = queue.Queue[str]()
+    completed_stats_queue = queue.SimpleQueue[str]()
     for username in completed_stats:
         completed_stats_queue.put_nowait(username)
 
     assert should_redraw(controller, completed_stats_queue) == result
 
+    # The queue is drained
+    assert completed_stats_queue.empty()
+
 
 @pytest.mark.parametrize(
     "loglines, resulting_controller, redraw_event_set",
@@ -315,20 +318,72 @@ def test_should_redraw(
             ),
             True,
         ),
+        (
+            (
+                f"{CHAT}Player1 has joined (1/16)!",
+                f"{CHAT}Player2 has joined (2/16)!",
+                f"{CHAT}[MVP+] Player1: hows ur day?",
+                f"{CHAT}Player3 has joined (3/16)!",
+            ),
+            MockedController(
+                state=create_state(
+                    lobby_players={"Player1", "Player2", "Player3"}, in_queue=True
+                )
+            ),
+            True,
+        ),
+        (
+            (f"{CHAT}Bed Wars", f"{CHAT}[MVP+] Player1: hows ur day?"),
+            MockedController(),
+            False,
+        ),
     ),
 )
+@pytest.mark.parametrize("max_batch_size", (1, 2, 16))
 def test_process_loglines(
-    loglines: tuple[str],
+    loglines: tuple[str, ...],
     resulting_controller: OverlayController,
     redraw_event_set: bool,
+    max_batch_size: int,
 ) -> None:
     controller = MockedController()
 
-    process_loglines(loglines, controller)
+    process_loglines(loglines, controller, max_batch_size=max_batch_size)
     assert controller == resulting_controller
     assert controller.redraw_event.is_set() == redraw_event_set
 
 
+def test_process_loglines_flushes_at_eof() -> None:
+    controller = MockedController()
+    at_eof = False
+
+    def loglines() -> Iterable[str]:
+        nonlocal at_eof
+
+        yield f"{CHAT}Player1 has joined (1/16)!"
+        at_eof = True
+        yield f"{CHAT}Player2 has joined (2/16)!"
+
+        # The batch is flushed when there are no more lines for now
+        assert controller.state.lobby_players == {"Player1", "Player2"}
+        assert controller.redraw_event.is_set()
+        controller.redraw_event.clear()
+
+        at_eof = False
+        yield f"{CHAT}Player3 has joined (3/16)!"
+        yield f"{CHAT}[MVP+] Player1: hows ur day?"
+
+        # The batch is not flushed while more lines are available
+        assert controller.state.lobby_players == {"Player1", "Player2"}
+        assert not controller.redraw_event.is_set()
+
+    process_loglines(loglines(), controller, at_eof=lambda: at_eof)
+
+    # The remaining batch is flushed when the lines run out
+    assert controller.state.lobby_players == {"Player1", "Player2", "Player3"}
+    assert controller.redraw_event.is_set()
+
+
 @pytest.mark.parametrize("winstreak_api_enabled", (True, False))
 @pytest.mark.parametrize("estimated_winstreaks", (True, False))
 def test_get_and_cache_stats(
@@ -372,7 +427,7 @@ def test_get_and_cache_stats(
         else (MISSING_WINSTREAKS, False)
     )
 
-    completed_queue = queue.Queue[str]()
+    completed_queue = queue.SimpleQueue[str]()
 
     # For typing
     assert user.nick is not None
@@ -400,8 +455,10 @@ def test_update_settings_nothing() -> None:
 
     update_settings(settings_before.to_dict(), controller)
 
-    # We store the settings every time, even if no changes occurred.
-    assert controller.settings == controller._stored_settings == settings_before
+    # A no-op update is skipped entirely: nothing is stored and we don't redraw
+    assert controller.settings == settings_before
+    assert controller._stored_settings is None
+    assert not controller.redraw_event.is_set()
 
 
 def test_update_settings_known_nicks() -> None:
@@ -425,7 +482,7 @@ def test_update_settings_known_nicks() -> None:
     ).to_dict()
 
     controller.player_cache.clear_cache = unittest.mock.MagicMock()  # type: ignore
-    controller.player_cache.uncache_player = unittest.mock.MagicMock()  # type: ignore
+    controller.player_cache.uncache_players = unittest.mock.MagicMock()  # type: ignore
 
     update_settings(new_settings, controller)
 
@@ -438,11 +495,10 @@ def test_update_settings_known_nicks() -> None:
     }
 
     controller.player_cache.clear_cache.assert_not_called()
-    controller.player_cache.uncache_player.assert_has_calls(
-        tuple(map(unittest.mock.call, ("AmazingNick", "SuperbNick", "OldNick"))),
-        any_order=True,
-    )
-    assert controller.player_cache.uncache_player.call_count == 3
+    # All the nicknames are uncached in one call
+    controller.player_cache.uncache_players.assert_called_once()
+    ((uncached_nicknames,), _) = controller.player_cache.uncache_players.call_args
+    assert sorted(uncached_nicknames) == ["AmazingNick", "OldNick", "SuperbNick"]
 
     # Nicknames changed, so we want to redraw
     assert controller.redraw_event.is_set()
@@ -467,7 +523,7 @@ def test_update_settings_everything_changed() -> None:
             "AmazingNick": {"uuid": "1", "comment": "my friend :)"},
             "SuperbNick": {"uuid": "42", "comment": "42"},
         },
-        show_on_tab=True
+        show_on_tab=True,
     )
 
     controller.player_cache.clear_cache = unittest.mock.MagicMock()  # type: ignore
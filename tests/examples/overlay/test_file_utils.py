@@ -1,4 +1,5 @@
 import datetime
+import threading
 import unittest.mock
 from collections.abc import Sequence
 from pathlib import Path
@@ -30,6 +31,8 @@ def get_seen_lines(
     start: datetime.datetime = datetime.datetime(2022, 1, 1, 12),
     reopen_timeout: int = REOPEN_TIMEOUT,
     poll_timeout: int = POLL_TIMEOUT,
+    at_eof: threading.Event | None = None,
+    seen_at_eof: list[bool] | None = None,
 ) -> tuple[list[str | None], list[float], MockedPath, MockedFile, MockedTime]:
     mocked_path, mocked_file, mocked_time = create_mocked_file(lines, amt_opens, start)
 
@@ -50,9 +53,12 @@ def get_seen_lines(
                 blocking=blocking,
                 reopen_timeout=reopen_timeout,
                 poll_timeout=poll_timeout,
+                at_eof=at_eof,
             ):
                 seen.append(line)
                 timestamps.append(mocked_time.time.monotonic())
+                if at_eof is not None and seen_at_eof is not None:
+                    seen_at_eof.append(at_eof.is_set())
 
     return seen, timestamps, mocked_path, mocked_file, mocked_time
 
@@ -186,3 +192,26 @@ def test_start_at() -> None:
     )
     assert seen == ["New text\n"] * 10
     assert timestamps == [1] * 10
+
+
+@pytest.mark.parametrize("blocking", (True, False))
+def test_at_eof(blocking: Literal[True, False]) -> None:
+    at_eof = threading.Event()
+    seen_at_eof: list[bool] = []
+
+    seen, timestamps, mocked_path, mocked_file, mocked_time = get_seen_lines(
+        [Line(0, "first"), Line(0, "second"), Line(2, "third")]
+        + [Line(3, "fourth"), Line(3, "fifth"), Line(3, "sixth")],
+        amt_opens=1,
+        start_at=0,
+        blocking=blocking,
+        at_eof=at_eof,
+        seen_at_eof=seen_at_eof,
+    )
+
+    # The flag is set for the last line of each burst of lines
+    assert [
+        line_at_eof
+        for line, line_at_eof in zip(seen, seen_at_eof, strict=True)
+        if line is not None
+    ] == [False, True, True, False, False, True]
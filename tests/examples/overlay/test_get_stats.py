@@ -163,6 +163,32 @@ def test_fetch_bedwars_stats(
     )
 
 
+def test_fetch_bedwars_stats_default_database() -> None:
+    user = users["NickedPlayer"]
+    assert user.playerdata is not None
+    assert user.nick is not None
+
+    # The nick is also the name of an existing account that has played on Hypixel
+    controller = make_scenario_controller(
+        user, make_user(username=user.nick, playerdata=True)
+    )
+
+    # The user has specified a denick for the nick
+    controller.nick_database.default_database[user.nick] = user.uuid
+
+    with unittest.mock.patch.object(controller, "get_uuid") as patched_get_uuid:
+        player = fetch_bedwars_stats(username=user.nick, controller=controller)
+
+    # The denick specified by the user wins, and Mojang is not consulted
+    patched_get_uuid.assert_not_called()
+    assert player == create_known_player(
+        playerdata=user.playerdata,
+        username=user.username,
+        uuid=user.uuid,
+        nick=user.nick,
+    )
+
+
 def test_get_bedwars_stats() -> None:
     controller = scenarios["nick"]
     user = users["NickedPlayer"]
@@ -24,6 +24,7 @@ from examples.overlay.events import (
     WhisperCommandSetNickEvent,
 )
 from examples.overlay.parsing import (
+    ANY_PREFIX_REGEX,
     CHAT_PREFIXES,
     CLIENT_INFO_PREFIXES,
     get_highest_index,
@@ -461,3 +462,9 @@ parsing_test_ids = [make_test_id(test_case) for test_case in parsing_test_cases]
 def test_parsing(logline: str, event: Event) -> None:
     """Assert that the correct events are returned from parse_logline"""
     assert parse_logline(logline) == event
+
+
+@pytest.mark.parametrize("prefix", CLIENT_INFO_PREFIXES + CHAT_PREFIXES)
+def test_any_prefix_regex(prefix: str) -> None:
+    """Assert that the pre-filter in parse_logline lets through every prefix"""
+    assert ANY_PREFIX_REGEX.search(f"[12:34:56] [main/INFO]: {prefix}message")
@@ -1,10 +1,13 @@
-from typing import Any
+from typing import Any, get_args
 
 import pytest
 
 from examples.overlay.player import (
+    KNOWN_PLAYER_FORMATTERS,
+    KNOWN_PLAYER_GETTERS,
     KnownPlayer,
     Player,
+    PropertyName,
     Stats,
     Winstreaks,
     create_known_player,
@@ -244,3 +247,10 @@ def test_create_known_player(example_playerdata: dict[str, Any]) -> None:
     )
 
     assert result == target
+
+
+def test_known_player_property_tables() -> None:
+    """Assert that every property has a getter and a formatter"""
+    property_names = set(get_args(PropertyName))
+    assert set(KNOWN_PLAYER_GETTERS.keys()) == property_names
+    assert set(KNOWN_PLAYER_FORMATTERS.keys()) == property_names
@@ -1,4 +1,11 @@
-from examples.overlay.player import NickedPlayer, PendingPlayer
+import logging
+from collections.abc import Callable
+from dataclasses import replace
+
+import pytest
+from cachetools import TTLCache
+
+from examples.overlay.player import KnownPlayer, NickedPlayer, PendingPlayer
 from examples.overlay.player_cache import PlayerCache
 from tests.examples.overlay.utils import make_player
 
@@ -16,6 +23,15 @@ def test_cache_manipulation() -> None:
     player_cache.uncache_player("somependingplayer")
     assert player_cache.get_cached_player("somependingplayer") is None
 
+    # Uncaching multiple players
+    player_cache.set_player_pending("somependingplayer")
+    player_cache.set_player_pending("someotherpendingplayer")
+    player_cache.uncache_players(
+        ("somependingplayer", "someotherpendingplayer", "thisentrydoesnotexist")
+    )
+    assert player_cache.get_cached_player("somependingplayer") is None
+    assert player_cache.get_cached_player("someotherpendingplayer") is None
+
     # Setting the cache
     nicked_player = NickedPlayer("AmazingNick")
     player_cache.set_cached_player("somenickedplayer", nicked_player)
@@ -42,7 +58,83 @@ def test_cache_manipulation() -> None:
         "thisentrydoesnotexist", lambda old: updated_player
     )
 
+    # Updating multiple players
+    player_cache.set_cached_player("someotherrealplayer", original_player)
+    player_cache.update_cached_players(
+        ("somerealplayer", "someotherrealplayer", "thisentrydoesnotexist"),
+        lambda old: replace(old, stars=300.0),
+    )
+    for ign in ("somerealplayer", "someotherrealplayer"):
+        cached_player = player_cache.get_cached_player(ign)
+        assert isinstance(cached_player, KnownPlayer)
+        assert cached_player.stars == 300.0
+
     # Clearing the entire cache
     player_cache.clear_cache()
     for ign in ("somependingplayer", "somenickedplayer", "somerealplayer"):
         assert player_cache.get_cached_player(ign) is None
+
+
+def test_cache_epoch() -> None:
+    player_cache = PlayerCache()
+    epoch = player_cache.epoch
+
+    # Reading the cache does not change the epoch
+    assert player_cache.get_cached_player("someplayer") is None
+    assert player_cache.epoch == epoch
+
+    mutations: tuple[Callable[[], object], ...] = (
+        lambda: player_cache.set_player_pending("someplayer"),
+        lambda: player_cache.set_cached_player("someplayer", make_player()),
+        lambda: player_cache.update_cached_player("someplayer", lambda old: old),
+        lambda: player_cache.update_cached_players(("someplayer",), lambda old: old),
+        lambda: player_cache.uncache_player("someplayer"),
+        lambda: player_cache.uncache_players(("someplayer",)),
+        player_cache.clear_cache,
+    )
+
+    for mutate in mutations:
+        mutate()
+        assert player_cache.epoch != epoch
+        epoch = player_cache.epoch
+
+    # Expiring entries changes the epoch
+    current_time = 0.0
+    player_cache._cache = TTLCache(maxsize=512, ttl=120, timer=lambda: current_time)
+    player_cache.set_player_pending("someplayer")
+    epoch = player_cache.epoch
+
+    current_time = 100
+    assert player_cache.epoch == epoch
+
+    current_time = 200
+    assert player_cache.epoch != epoch
+
+
+def test_update_cached_players_logs_outside_lock(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    player_cache = PlayerCache()
+    player_cache.set_cached_player("somerealplayer", make_player(username="joe"))
+
+    lock_held_while_logging: list[bool] = []
+
+    class LockCheckingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            lock_held_while_logging.append(player_cache._mutex.locked())
+
+    handler = LockCheckingHandler()
+    logging.getLogger("examples.overlay.player_cache").addHandler(handler)
+    try:
+        with caplog.at_level(logging.WARNING):
+            player_cache.update_cached_players(
+                ("somerealplayer", "missing1", "missing2"), lambda old: old
+            )
+    finally:
+        logging.getLogger("examples.overlay.player_cache").removeHandler(handler)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Player missing1 not found during update",
+        "Player missing2 not found during update",
+    ]
+    assert lock_held_while_logging == [False, False]
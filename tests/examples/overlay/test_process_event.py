@@ -6,6 +6,7 @@ from examples.overlay.controller import OverlayController
 from examples.overlay.events import (
     EndBedwarsGameEvent,
     Event,
+    EventType,
     InitializeAsEvent,
     LobbyJoinEvent,
     LobbyLeaveEvent,
@@ -22,7 +23,7 @@ from examples.overlay.events import (
     StartBedwarsGameEvent,
     WhisperCommandSetNickEvent,
 )
-from examples.overlay.process_event import process_event
+from examples.overlay.process_event import EVENT_HANDLERS, process_event
 from tests.examples.overlay.utils import OWN_USERNAME, MockedController, create_state
 
 process_event_test_cases_base: tuple[
@@ -335,13 +336,13 @@ def test_process_event(
     assert will_redraw == redraw
 
 
-@pytest.mark.parametrize(
-    "event",
-    (
-        NewNicknameEvent("AmazingNick"),
-        WhisperCommandSetNickEvent(nick="AmazingNick", username="MyIGN"),
-    ),
+set_nickname_events: tuple[Event, ...] = (
+    NewNicknameEvent("AmazingNick"),
+    WhisperCommandSetNickEvent(nick="AmazingNick", username="MyIGN"),
 )
+
+
+@pytest.mark.parametrize("event", set_nickname_events)
 def test_process_event_set_nickname(event: Event) -> None:
     """Assert that set_nickname is called properly"""
     username = "MyIGN"
@@ -369,3 +370,15 @@ def test_process_event_set_hypixel_api_key() -> None:
 
     assert patched_set_hypixel_api_key.called_with("my-new-key")
     assert will_redraw
+
+
+def test_process_event_handles_every_event_type() -> None:
+    """Assert that every event type has a handler exercised by the tests above"""
+    assert set(EVENT_HANDLERS.keys()) == set(EventType)
+
+    tested_events = (
+        *(test_case[1] for test_case in process_event_test_cases),
+        *set_nickname_events,
+        NewAPIKeyEvent("my-new-key"),
+    )
+    assert {event.event_type for event in tested_events} == set(EventType)
@@ -1,4 +1,5 @@
 import dataclasses
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -85,6 +86,77 @@ def test_settings_update_from(settings_dict: SettingsDict, result: Settings) ->
     assert settings == result
 
 
+def test_settings_uuid_to_nick() -> None:
+    settings = Settings.from_dict(
+        make_settings_dict(
+            known_nicks={
+                "AmazingNick": {"uuid": "1", "comment": "1"},
+                "SuperbNick": {"uuid": "2", "comment": "2"},
+                "OtherNick": {"uuid": "2", "comment": "2"},
+            }
+        ),
+        path=PLACEHOLDER_PATH,
+    )
+    # The first nick is kept for duplicate uuids
+    assert settings.uuid_to_nick == {"1": "AmazingNick", "2": "SuperbNick"}
+
+    settings.set_known_nick("AmazingNick", {"uuid": "3", "comment": "3"})
+    assert settings.known_nicks["AmazingNick"] == {"uuid": "3", "comment": "3"}
+    assert settings.uuid_to_nick == {"2": "SuperbNick", "3": "AmazingNick"}
+
+    settings.remove_known_nick("OtherNick")
+    assert "OtherNick" not in settings.known_nicks
+    assert settings.uuid_to_nick == {"2": "SuperbNick", "3": "AmazingNick"}
+
+    settings.remove_known_nick("SuperbNick")
+    settings.remove_known_nick("MissingNick")
+    assert settings.known_nicks == {"AmazingNick": {"uuid": "3", "comment": "3"}}
+    assert settings.uuid_to_nick == {"3": "AmazingNick"}
+
+    settings.update_from(
+        make_settings_dict(known_nicks={"NewNick": {"uuid": "4", "comment": "4"}})
+    )
+    assert settings.uuid_to_nick == {"4": "NewNick"}
+
+
+def test_settings_uuid_to_nick_shared_uuid() -> None:
+    settings = Settings.from_dict(
+        make_settings_dict(
+            known_nicks={
+                "FirstNick": {"uuid": "1", "comment": "1"},
+                "SecondNick": {"uuid": "1", "comment": "1"},
+                "ThirdNick": {"uuid": "1", "comment": "1"},
+            }
+        ),
+        path=PLACEHOLDER_PATH,
+    )
+    assert settings.uuid_to_nick == {"1": "FirstNick"}
+
+    # Removing a nick that is not indexed keeps the index
+    settings.remove_known_nick("SecondNick")
+    assert settings.uuid_to_nick == {"1": "FirstNick"}
+
+    # Re-adding a nick does not take over the index
+    settings.set_known_nick("SecondNick", {"uuid": "1", "comment": "1"})
+    assert settings.uuid_to_nick == {"1": "FirstNick"}
+
+    # Removing the indexed nick falls back to the next nick for the uuid
+    settings.remove_known_nick("FirstNick")
+    assert settings.uuid_to_nick == {"1": "ThirdNick"}
+
+    # Moving the indexed nick to another uuid
+    settings.set_known_nick("ThirdNick", {"uuid": "2", "comment": "2"})
+    assert settings.uuid_to_nick == {"1": "SecondNick", "2": "ThirdNick"}
+
+    settings.remove_known_nick("SecondNick")
+    assert settings.uuid_to_nick == {"2": "ThirdNick"}
+
+    # The index matches a rebuild from known_nicks
+    uuid_to_nick = settings.uuid_to_nick
+    settings.index_known_nicks()
+    assert settings.uuid_to_nick == uuid_to_nick
+
+
 @pytest.mark.parametrize(
     "value, default, result",
     (
@@ -141,12 +213,58 @@ def test_flush_settings_from_controller(tmp_path: Path) -> None:
         state=create_state(), settings=settings, nick_database=NickDatabase([{}])
     )
 
-    controller.store_settings()
+    controller.store_settings(settings.snapshot())
 
     # File properly stored
     assert get_settings(settings.path, get_api_key) == settings
 
 
+def test_flush_settings_drops_stale_snapshots(tmp_path: Path) -> None:
+    settings = make_settings(hypixel_api_key="first-key", path=tmp_path / "s.toml")
+
+    first_snapshot_taken = threading.Event()
+    second_snapshot_flushed = threading.Event()
+
+    def first_writer() -> None:
+        with settings.mutex:
+            settings.hypixel_api_key = "first-key"
+            snapshot = settings.snapshot()
+        first_snapshot_taken.set()
+
+        # Flush after the newer snapshot has been written
+        second_snapshot_flushed.wait()
+        settings.flush_to_disk(snapshot)
+
+    def second_writer() -> None:
+        first_snapshot_taken.wait()
+        with settings.mutex:
+            settings.hypixel_api_key = "second-key"
+            snapshot = settings.snapshot()
+
+        settings.flush_to_disk(snapshot)
+        second_snapshot_flushed.set()
+
+    threads = [
+        threading.Thread(target=first_writer),
+        threading.Thread(target=second_writer),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The stale snapshot from the first writer was dropped
+    assert read_settings(settings.path)["hypixel_api_key"] == "second-key"
+    assert settings.flushed_generation == 2
+
+    # New snapshots are still written
+    with settings.mutex:
+        settings.hypixel_api_key = "third-key"
+        snapshot = settings.snapshot()
+    settings.flush_to_disk(snapshot)
+    assert read_settings(settings.path)["hypixel_api_key"] == "third-key"
+
+
 fill_settings_test_cases: tuple[tuple[dict[str, Any], SettingsDict, bool], ...] = (
     (
         {
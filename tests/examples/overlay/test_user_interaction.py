@@ -10,7 +10,7 @@ from examples.overlay.user_interaction import (
     search_settings_file_for_key,
     suggest_logfiles,
 )
-from tests.mock_utils import Line, MockedIOModule, MockedOsModule, create_mocked_file
+from tests.mock_utils import Line, create_mocked_file
 
 UNSET_EVENT = threading.Event()
 SET_EVENT = threading.Event()
@@ -54,8 +54,6 @@ def test_get_timestamp(tmp_path: Path) -> None:
     assert get_timestamp(str(tmp_path / "doesnotexist")) == 0
 
 
-@unittest.mock.patch("toml.decoder.io", MockedIOModule)
-@unittest.mock.patch("os.fspath", MockedOsModule.fspath)
 def test_search_settings_file_for_key() -> None:
     mocked_path, mocked_file, mocked_time = create_mocked_file(
         (
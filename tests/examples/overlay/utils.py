@@ -14,7 +14,12 @@ from examples.overlay.player import (
     Winstreaks,
 )
 from examples.overlay.player_cache import PlayerCache
-from examples.overlay.settings import NickValue, Settings, fill_missing_settings
+from examples.overlay.settings import (
+    NickValue,
+    Settings,
+    SettingsSnapshot,
+    fill_missing_settings,
+)
 from examples.overlay.state import OverlayState
 
 # Username set by default in create_state
@@ -179,5 +184,8 @@ class MockedController:
     def set_antisniper_api_key(self, new_key: str | None) -> None:
         self.antisniper_api_key = new_key
 
-    def store_settings(self) -> None:
+    def store_settings(self, snapshot: SettingsSnapshot) -> None:
+        assert (
+            snapshot.serialized == self.settings.serialize()
+        ), "Stored a stale snapshot"
         self._stored_settings = replace(self.settings)
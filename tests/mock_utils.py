@@ -1,14 +1,17 @@
+import bisect
 import datetime
-import os
+import functools
+import itertools
+import math
 import threading
 from collections.abc import Sequence
 from dataclasses import dataclass
-from pathlib import Path, PurePath
+from datetime import timedelta
+from os import SEEK_CUR, SEEK_END, SEEK_SET
+from pathlib import Path
 from types import TracebackType
 from typing import Any
 
-real_fspath = os.fspath
-
 
 class EndFileTest(Exception):
     """Exception raised when a file-mock test should end"""
@@ -16,16 +19,45 @@ class EndFileTest(Exception):
     pass
 
 
+class _ThreadClock(threading.local):
+    """The mocked clock of the current thread"""
+
+    def __init__(self, start: datetime.datetime) -> None:
+        # Called once in each thread that accesses the clock
+        self.current_time = 0.0
+        self.current_datetime = start
+
+
+@dataclass(slots=True)
+class _SharedClock:
+    """A mocked clock shared by all threads"""
+
+    current_time: float
+    current_datetime: datetime.datetime
+
+
 class MockedTime:
-    """Class mocking time-related functionality"""
+    """
+    Class mocking time-related functionality
+
+    By default each thread keeps its own clock, starting at 0 / start.
+    Pass single_threaded=True to use one plain clock when only a single thread
+    accesses the mocked time, skipping the thread-local lookup.
+    """
 
     def __init__(
-        self, start: datetime.datetime = datetime.datetime(2022, 1, 1, 12)
+        self,
+        start: datetime.datetime = datetime.datetime(2022, 1, 1, 12),
+        *,
+        single_threaded: bool = False,
     ) -> None:
         self.start = start
 
-        self._current_time: dict[int, float] = {}
-        self._current_datetime: dict[int, datetime.datetime] = {}
+        self._thread_clock: _ThreadClock | _SharedClock
+        if single_threaded:
+            self._thread_clock = _SharedClock(current_time=0.0, current_datetime=start)
+        else:
+            self._thread_clock = _ThreadClock(start)
 
         self.time = _MockedTimeModule(self)
         self.datetime = _MockedDateTime(self)
@@ -33,19 +65,25 @@ class MockedTime:
 
     @property
     def current_time(self) -> float:
-        return self._current_time.get(threading.get_ident(), 0.0)
+        return self._thread_clock.current_time
 
     @current_time.setter
     def current_time(self, new_time: float) -> None:
-        self._current_time[threading.get_ident()] = new_time
+        self._thread_clock.current_time = new_time
 
     @property
     def current_datetime(self) -> datetime.datetime:
-        return self._current_datetime.get(threading.get_ident(), self.start)
+        return self._thread_clock.current_datetime
 
     @current_datetime.setter
     def current_datetime(self, new_datetime: datetime.datetime) -> None:
-        self._current_datetime[threading.get_ident()] = new_datetime
+        self._thread_clock.current_datetime = new_datetime
+
+    def _advance(self, seconds: float) -> None:
+        """Advance both clocks of the current thread by `seconds`"""
+        thread_clock = self._thread_clock
+        thread_clock.current_time += seconds
+        thread_clock.current_datetime += timedelta(seconds=seconds)
 
 
 @dataclass
@@ -58,13 +96,16 @@ class _MockedTimeModule:
         """Mock time.sleep"""
         assert seconds >= 0
 
-        self.parent.current_time += seconds
-        self.parent.current_datetime += datetime.timedelta(seconds=seconds)
+        self.parent._advance(seconds)
 
     def monotonic(self) -> float:
         """Mock time.monotonic"""
         return self.parent.current_time
 
+    def time(self) -> float:
+        """Mock time.time"""
+        return self.parent.current_time
+
 
 @dataclass
 class _MockedDateTime:
@@ -88,30 +129,71 @@ class _MockedDate:
         return self.parent.current_datetime.date()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Line:
     time: float  # The time the line was written
     content: str | None  # The line of text (no \n) or None to clear the file
 
 
+# The file contents after the first i lines have been written, as the current
+# segment (lines since the last clear) and the amount of lines in it that are written
+PrefixContents = tuple[tuple[tuple[str, ...], int], ...]
+
+
+@functools.lru_cache(maxsize=64)
+def _index_lines(lines: tuple[Line, ...]) -> tuple[tuple[float, ...], PrefixContents]:
+    """
+    Return the line timestamps and the contents after each amount of written lines
+
+    Cached so that files created from the same lines share the precomputation
+    """
+    line_times = tuple(line.time for line in lines)
+
+    assert all(
+        t1 <= t2 for t1, t2 in itertools.pairwise(line_times)
+    ), "Line timestamps must be sorted"
+
+    # Split the lines into segments separated by file clears
+    segment_lists: list[list[str]] = [[]]
+    for line in lines:
+        if line.content is None:
+            segment_lists.append([])
+        else:
+            segment_lists[-1].append(f"{line.content}\n")
+    segments = [tuple(segment) for segment in segment_lists]
+
+    prefix_contents = [(segments[0], 0)]
+    segment_index = 0
+    written_in_segment = 0
+    for line in lines:
+        if line.content is None:
+            segment_index += 1
+            written_in_segment = 0
+        else:
+            written_in_segment += 1
+        prefix_contents.append((segments[segment_index], written_in_segment))
+
+    return line_times, tuple(prefix_contents)
+
+
 class MockedFile:
     """Class mocking an opened file"""
 
     def __init__(self, lines: Sequence[Line], mocked_time: MockedTime) -> None:
-        assert all(
-            l1.time <= l2.time for l1, l2 in zip(lines[:-1], lines[1:], strict=True)
-        ), "Line timestamps must be sorted"
-
         self.mocked_time = mocked_time
-        self.lines = lines
+        self._monotonic = mocked_time.time.monotonic
+        self.lines = tuple(lines)
+        self._line_times, self._prefix_contents = _index_lines(self.lines)
 
-        self.contents: list[str] = []
+        self.contents, self.content_length = self._prefix_contents[0]
+        # The time self.contents was last set at. self.lines never change
+        self._contents_time = -math.inf
         self.content_index = 0
 
     def __enter__(self) -> "MockedFile":
         """Enable context manager functionality"""
         # Seek to start of file when opening
-        self.seek(0, os.SEEK_SET)
+        self.seek(0, SEEK_SET)
         return self
 
     def __exit__(
@@ -129,17 +211,15 @@ class MockedFile:
 
         NOTE: Unread lines on file clear will be lost, like with a real file
         """
-        self.contents.clear()
-
-        for line in self.lines:
-            if line.time > self.mocked_time.time.monotonic():
-                # This and further lines are in the future
-                break
+        current_time = self._monotonic()
+        if current_time == self._contents_time:
+            # The contents are already up to date
+            return
+        self._contents_time = current_time
 
-            if line.content is None:
-                self.contents.clear()
-            else:
-                self.contents.append(f"{line.content}\n")
+        # The amount of lines written at or before the current time
+        amt_written = bisect.bisect_right(self._line_times, current_time)
+        self.contents, self.content_length = self._prefix_contents[amt_written]
 
     def read(self, arg: int | None = None) -> str:
         """Mocked read"""
@@ -147,12 +227,11 @@ class MockedFile:
 
         self._set_contents()
 
-        if self.content_index >= len(self.contents):
+        if self.content_index >= self.content_length:
             return ""
 
-        output = ""
-        while (new_line := self.readline()) != "":
-            output += new_line
+        output = "".join(self.contents[self.content_index : self.content_length])
+        self.content_index = self.content_length
 
         return output
 
@@ -160,7 +239,7 @@ class MockedFile:
         """Mocked readline"""
         self._set_contents()
 
-        if self.content_index >= len(self.contents):
+        if self.content_index >= self.content_length:
             return ""
 
         line = self.contents[self.content_index]
@@ -176,12 +255,12 @@ class MockedFile:
         """Mocked seek"""
         self._set_contents()
 
-        if whence == os.SEEK_SET:  # 0
+        if whence == SEEK_SET:  # 0
             self.content_index = offset
-        elif whence == os.SEEK_CUR:  # 1
+        elif whence == SEEK_CUR:  # 1
             self.content_index += offset
-        elif whence == os.SEEK_END:  # 2
-            self.content_index = len(self.contents) + offset
+        elif whence == SEEK_END:  # 2
+            self.content_index = self.content_length + offset
         else:
             raise ValueError(f"{whence=} is invalid")
 
@@ -189,15 +268,13 @@ class MockedFile:
 class MockedPath:
     """Class mocking a path, returning a MockedFile"""
 
-    # Pass isinstance checks
-    __class__ = PurePath  # type: ignore
-
     def __init__(
         self, file: MockedFile, amt_opens: int, mocked_time: MockedTime
     ) -> None:
         self.file = file
         self.opens_remaining = amt_opens
         self.mocked_time = mocked_time
+        self._monotonic = mocked_time.time.monotonic
         self.calls: list[tuple[float, tuple[Any, ...], dict[str, Any]]] = []
 
     def open(self, *args: Any, **kwargs: Any) -> MockedFile:
@@ -207,26 +284,10 @@ class MockedPath:
         if self.opens_remaining < 0:
             raise EndFileTest
 
-        self.calls.append((self.mocked_time.time.monotonic(), args, kwargs))
+        self.calls.append((self._monotonic(), args, kwargs))
         return self.file
 
 
-class MockedIOModule:
-    @staticmethod
-    def open(path: Any, *args: Any, **kwargs: Any) -> MockedFile:
-        assert isinstance(path, MockedPath)
-        return path.open()
-
-
-class MockedOsModule:
-    @staticmethod
-    def fspath(path: Any, *args: Any, **kwargs: Any) -> MockedPath | Any:
-        if isinstance(path, MockedPath):
-            return path
-        else:
-            return real_fspath(path)
-
-
 def create_mocked_time(
     start: datetime.datetime = datetime.datetime(2022, 1, 1, 12)
 ) -> tuple[Path, MockedPath]:
@@ -238,7 +299,7 @@ def create_mocked_file(
     amt_opens: int,
     start: datetime.datetime = datetime.datetime(2022, 1, 1, 12),
 ) -> tuple[MockedPath, MockedFile, MockedTime]:
-    mocked_time = MockedTime(start)
+    mocked_time = MockedTime(start, single_threaded=True)
     mocked_file = MockedFile(lines, mocked_time)
     mocked_path = MockedPath(mocked_file, amt_opens, mocked_time)
     return mocked_path, mocked_file, mocked_time
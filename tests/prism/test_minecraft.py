@@ -0,0 +1,243 @@
+import functools
+import json
+import unittest.mock
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from prism import minecraft
+from prism.minecraft import (
+    BULK_PROFILES_ENDPOINT,
+    LOWERCASE_UUID_CACHE,
+    UUID_MUTEX,
+    DiskUUIDCache,
+    MojangAPIError,
+    _get_cached_uuid,
+    _set_cached_uuid,
+    get_uuids,
+    set_disk_uuid_cache,
+)
+from prism.utils import send_ratelimited
+from tests.mock_utils import MockedTime
+
+
+def test_disk_uuid_cache(tmp_path: Path) -> None:
+    path = tmp_path / "uuid_cache.sqlite"
+    mocked_time = MockedTime()
+
+    with unittest.mock.patch("prism.minecraft.time", mocked_time.time):
+        disk_uuid_cache = DiskUUIDCache(path, ttl=100)
+        assert disk_uuid_cache.get("Player") is None
+
+        disk_uuid_cache.set("Player", "player-uuid")
+        # Keyed by the lowercase username
+        assert disk_uuid_cache.get("Player") == "player-uuid"
+        assert disk_uuid_cache.get("pLaYeR") == "player-uuid"
+
+        # Overwriting an entry
+        disk_uuid_cache.set("player", "new-player-uuid")
+        assert disk_uuid_cache.get("Player") == "new-player-uuid"
+
+        disk_uuid_cache.close()
+
+        # The cache persists on disk
+        disk_uuid_cache = DiskUUIDCache(path, ttl=100)
+        assert disk_uuid_cache.get("Player") == "new-player-uuid"
+
+        # Stale entries are missing
+        mocked_time.current_time = 101
+        assert disk_uuid_cache.get("Player") is None
+
+        disk_uuid_cache.close()
+
+
+def test_set_disk_uuid_cache(tmp_path: Path) -> None:
+    disk_uuid_cache = DiskUUIDCache(tmp_path / "uuid_cache.sqlite")
+
+    set_disk_uuid_cache(disk_uuid_cache)
+    assert minecraft.DISK_UUID_CACHE is disk_uuid_cache
+
+    set_disk_uuid_cache(None)
+    assert minecraft.DISK_UUID_CACHE is None
+
+    disk_uuid_cache.close()
+
+
+def test_cached_uuid(tmp_path: Path) -> None:
+    disk_uuid_cache = DiskUUIDCache(tmp_path / "uuid_cache.sqlite")
+
+    with UUID_MUTEX:
+        LOWERCASE_UUID_CACHE.pop("cacheduser", None)
+
+    set_disk_uuid_cache(disk_uuid_cache)
+    try:
+        with UUID_MUTEX:
+            assert _get_cached_uuid("CachedUser") is None
+
+            _set_cached_uuid("CachedUser", "cached-user-uuid")
+            assert LOWERCASE_UUID_CACHE["cacheduser"] == "cached-user-uuid"
+            assert disk_uuid_cache.get("cacheduser") == "cached-user-uuid"
+
+            # Hits in the disk cache populate the memory cache
+            LOWERCASE_UUID_CACHE.pop("cacheduser")
+            assert _get_cached_uuid("cachedUSER") == "cached-user-uuid"
+            assert LOWERCASE_UUID_CACHE["cacheduser"] == "cached-user-uuid"
+
+            # Errors from the disk cache are ignored
+            LOWERCASE_UUID_CACHE.pop("cacheduser")
+            disk_uuid_cache.close()
+            assert _get_cached_uuid("CachedUser") is None
+            _set_cached_uuid("CachedUser", "cached-user-uuid")
+            assert _get_cached_uuid("CachedUser") == "cached-user-uuid"
+    finally:
+        set_disk_uuid_cache(None)
+        with UUID_MUTEX:
+            LOWERCASE_UUID_CACHE.pop("cacheduser", None)
+
+
+def make_response(status_code: int, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+def profiles_response(usernames: list[str]) -> requests.Response:
+    """Bulk response with all the usernames, using the uppercase name as uuid"""
+    return make_response(
+        200,
+        json.dumps(
+            [
+                {"id": f"{username.upper()}-uuid", "name": username.upper()}
+                for username in usernames
+            ]
+        ).encode(),
+    )
+
+
+@pytest.fixture(name="clean_uuid_cache")
+def fixture_clean_uuid_cache() -> Iterator[None]:
+    with UUID_MUTEX:
+        LOWERCASE_UUID_CACHE.clear()
+    yield
+    set_disk_uuid_cache(None)
+    with UUID_MUTEX:
+        LOWERCASE_UUID_CACHE.clear()
+
+
+@pytest.mark.usefixtures("clean_uuid_cache")
+def test_get_uuids_batching() -> None:
+    usernames = [f"Player{i}" for i in range(12)]
+
+    def post(url: str, json: list[str], **kwargs: Any) -> requests.Response:
+        assert url == BULK_PROFILES_ENDPOINT
+        return profiles_response(json)
+
+    with unittest.mock.patch.object(
+        minecraft.session, "post", side_effect=post
+    ) as mocked_post:
+        # Duplicates are only requested once
+        uuids = get_uuids(usernames + ["player0", "PLAYER1"])
+
+    assert uuids == {
+        username.lower(): f"{username.upper()}-uuid" for username in usernames
+    }
+
+    # One request per BULK_PROFILES_LIMIT usernames
+    assert [call.kwargs["json"] for call in mocked_post.call_args_list] == [
+        [username.lower() for username in usernames[:10]],
+        [username.lower() for username in usernames[10:]],
+    ]
+
+    # The found users are cached
+    with UUID_MUTEX:
+        assert _get_cached_uuid("Player11") == "PLAYER11-uuid"
+
+    with unittest.mock.patch.object(minecraft.session, "post") as mocked_post:
+        assert get_uuids(["player3", "Player11"]) == {
+            "player3": "PLAYER3-uuid",
+            "player11": "PLAYER11-uuid",
+        }
+    mocked_post.assert_not_called()
+
+
+@pytest.mark.usefixtures("clean_uuid_cache")
+def test_get_uuids_missing() -> None:
+    with unittest.mock.patch.object(
+        minecraft.session,
+        "post",
+        return_value=profiles_response(["Found"]),
+    ) as mocked_post:
+        assert get_uuids(["Found", "Missing"]) == {"found": "FOUND-uuid"}
+    mocked_post.assert_called_once()
+
+    # Missing users are not cached
+    with UUID_MUTEX:
+        assert _get_cached_uuid("found") == "FOUND-uuid"
+        assert _get_cached_uuid("missing") is None
+
+    assert get_uuids([]) == {}
+
+
+@pytest.mark.usefixtures("clean_uuid_cache")
+def test_get_uuids_disk_cache(tmp_path: Path) -> None:
+    disk_uuid_cache = DiskUUIDCache(tmp_path / "uuid_cache.sqlite")
+    disk_uuid_cache.set("OnDisk", "ondisk-uuid")
+    set_disk_uuid_cache(disk_uuid_cache)
+
+    with unittest.mock.patch.object(
+        minecraft.session,
+        "post",
+        return_value=profiles_response(["NotOnDisk"]),
+    ) as mocked_post:
+        assert get_uuids(["OnDisk", "NotOnDisk"]) == {
+            "ondisk": "ondisk-uuid",
+            "notondisk": "NOTONDISK-uuid",
+        }
+
+    # Only the miss is requested, and then stored on disk
+    assert mocked_post.call_args.kwargs["json"] == ["notondisk"]
+    assert disk_uuid_cache.get("NotOnDisk") == "NOTONDISK-uuid"
+
+    disk_uuid_cache.close()
+
+
+@pytest.mark.parametrize(
+    "response",
+    (
+        make_response(400, b'{"error": "bad request"}'),
+        make_response(404, b""),
+        make_response(204, b""),
+        make_response(200, b"not json"),
+        make_response(200, b'{"id": "uuid", "name": "player"}'),
+        make_response(200, b'["player"]'),
+        make_response(200, b'[{"name": "player"}]'),
+        make_response(200, b'[{"id": 1234, "name": "player"}]'),
+        make_response(200, b'[{"id": "uuid", "name": null}]'),
+    ),
+)
+@pytest.mark.usefixtures("clean_uuid_cache")
+def test_get_uuids_malformed(response: requests.Response) -> None:
+    with unittest.mock.patch.object(
+        minecraft.session, "post", return_value=response
+    ), pytest.raises(MojangAPIError):
+        get_uuids(["player"])
+
+    with UUID_MUTEX:
+        assert _get_cached_uuid("player") is None
+
+
+@pytest.mark.usefixtures("clean_uuid_cache")
+def test_get_uuids_connection_error() -> None:
+    with unittest.mock.patch(
+        "prism.minecraft.send_ratelimited",
+        functools.partial(send_ratelimited, retries=0),
+    ), unittest.mock.patch.object(
+        minecraft.session, "post", side_effect=requests.ConnectionError
+    ), pytest.raises(
+        MojangAPIError
+    ):
+        get_uuids(["player"])
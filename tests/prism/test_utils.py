@@ -1,22 +1,106 @@
+import unittest.mock
 from collections import deque
 from pathlib import Path
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
+from prism.ratelimiting import RateLimiter
 from prism.utils import (
     Element,
     Time,
     div,
     format_seconds,
     insort_right,
+    make_session,
     pluralize,
     read_key,
+    send_ratelimited,
     truncate_float,
 )
 
 INF = float("inf")
 
 
+def test_make_session() -> None:
+    session = make_session(pool_maxsize=7)
+    adapter = session.get_adapter("https://api.hypixel.net/player")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 7  # type: ignore[attr-defined]
+    # Retries are done by send_ratelimited so that each attempt is ratelimited
+    assert adapter.max_retries.total == 0
+
+
+class CountingRateLimiter(RateLimiter):
+    """RateLimiter counting the amount of acquired slots"""
+
+    def __init__(self) -> None:
+        super().__init__(limit=100, window=1)
+        self.acquisitions = 0
+
+    def __enter__(self) -> None:
+        super().__enter__()
+        self.acquisitions += 1
+
+
+def make_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+@pytest.mark.parametrize(
+    "outcomes, retries, result_status, attempts, sleeps",
+    (
+        ((200,), 3, 200, 1, []),
+        ((404,), 3, 404, 1, []),
+        ((503, 200), 3, 200, 2, [0.2]),
+        ((500, requests.ConnectionError(), 502, 200), 3, 200, 4, [0.2, 0.4, 0.8]),
+        ((503, 503, 503), 2, 503, 3, [0.2, 0.4]),
+        ((503, 200), 0, 503, 1, []),
+        ((requests.ConnectionError(),) * 2, 1, None, 2, [0.2]),
+    ),
+)
+def test_send_ratelimited(
+    outcomes: tuple[int | requests.ConnectionError, ...],
+    retries: int,
+    result_status: int | None,
+    attempts: int,
+    sleeps: list[float],
+) -> None:
+    """Assert that every attempt is ratelimited and transient errors are retried"""
+    remaining_outcomes = list(outcomes)
+    sent: list[None] = []
+    slept: list[float] = []
+
+    def send() -> requests.Response:
+        sent.append(None)
+        outcome = remaining_outcomes.pop(0)
+        if isinstance(outcome, requests.ConnectionError):
+            raise outcome
+        return make_response(outcome)
+
+    with unittest.mock.patch(
+        "prism.ratelimiting.time"
+    ) as patched_limiter_time, unittest.mock.patch("prism.utils.time") as patched_time:
+        patched_limiter_time.monotonic.return_value = 0
+        patched_time.sleep.side_effect = slept.append
+
+        limiter = CountingRateLimiter()
+
+        if result_status is None:
+            with pytest.raises(requests.ConnectionError):
+                send_ratelimited(limiter, send, retries=retries, backoff=0.2)
+        else:
+            response = send_ratelimited(limiter, send, retries=retries, backoff=0.2)
+            assert response.status_code == result_status
+
+    assert len(sent) == attempts
+    assert limiter.acquisitions == attempts
+    assert slept == pytest.approx(sleeps)
+
+
 @pytest.mark.parametrize(
     "file_content, key",
     (